@@ -3,20 +3,97 @@ Professional API Documentation for VoidSight Analytics
 Enterprise-grade API documentation with Swagger/OpenAPI integration
 """
 
-from flask import Blueprint
-from flask_restx import Api, Resource, fields, Namespace
-from functools import wraps
-from werkzeug.exceptions import ValidationError
+import gzip
+import hashlib
+import html
+import inspect
+import json
+import logging
+import random
+import statistics
+from decimal import Decimal
+from flask import Blueprint, Response, make_response, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask_restx import Api, Model, Resource, fields, marshal, Namespace
+from datetime import datetime
+from functools import lru_cache, wraps
+from utils.cache import SimpleCache
+from utils.compression import compress_response
+from utils.validators import ValidationError
 
-# Create API documentation blueprint
-api_bp = Blueprint('api_docs', __name__)
+# Optional Brotli support for the pre-compressed swagger.json
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Optional orjson for faster, compact JSON encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional NumPy for vectorized Monte Carlo sampling
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional msgpack for the binary, column-oriented representation
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Compact stdlib settings used when orjson is not installed
+COMPACT_JSON = {'separators': (',', ':'), 'ensure_ascii': False}
+
+def _dumps(data):
+    """Encode data as compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, **COMPACT_JSON).encode('utf-8')
 
-# Initialize Flask-RESTx API with professional configuration
-api = Api(
-    api_bp,
-    version='2.0',
-    title='VoidSight Analytics API',
-    description='''
+def output_json(data, code, headers=None):
+    """Compact JSON representation for the docs Api (no pretty-printing)"""
+    resp = make_response(_dumps(data), code)
+    resp.headers.extend(headers or {})
+    resp.mimetype = 'application/json'
+    return resp
+
+def _columnar_cash_flow(data):
+    """Turn cash_flow_projection rows into one array per field"""
+    rows = data.get('cash_flow_projection') if isinstance(data, dict) else None
+    if not rows:
+        return data
+    columns = {key: [row.get(key) for row in rows] for key in rows[0]}
+    return dict(data, cash_flow_projection=columns)
+
+def _packb(data):
+    """Encode data as msgpack with the cash flow projection in columns"""
+    return msgpack.packb(_columnar_cash_flow(data), use_bin_type=True)
+
+def output_msgpack(data, code, headers=None):
+    """Binary msgpack representation, negotiated with Accept: application/msgpack"""
+    resp = make_response(_packb(data), code)
+    resp.headers.extend(headers or {})
+    resp.mimetype = 'application/msgpack'
+    return resp
+
+# Body encoders per response media type, JSON first as the default
+RESPONSE_ENCODERS = {'application/json': _dumps}
+if MSGPACK_AVAILABLE:
+    RESPONSE_ENCODERS['application/msgpack'] = _packb
+
+# API overview rendered at the top of the Swagger UI, dedented once at import
+# (the source indentation would otherwise turn the markdown into a code block)
+API_DESCRIPTION = inspect.cleandoc('''
     **Enterprise ROI Intelligence Platform API**
     
     Professional RESTful API for business ROI calculations, scenario analysis, and financial modeling.
@@ -45,343 +122,969 @@ api = Api(
     - Documentation: https://docs.voidsight.com
     - Support: support@voidsight.com
     - Status: https://status.voidsight.com
-    ''',
-    doc='/docs/',
-    authorizations={
-        'Bearer': {
-            'type': 'apiKey',
-            'in': 'header',
-            'name': 'Authorization',
-            'description': 'JWT Authorization header using the Bearer scheme. Example: "Authorization: Bearer {token}"'
-        }
-    },
-    security='Bearer'
-)
-
-# Define namespaces for organized documentation
-calculations_ns = Namespace('calculations', description='ROI calculation operations')
-scenarios_ns = Namespace('scenarios', description='Scenario analysis and what-if modeling')
-reports_ns = Namespace('reports', description='Professional report generation')
-auth_ns = Namespace('auth', description='Authentication and user management')
-analytics_ns = Namespace('analytics', description='Advanced analytics and insights')
-
-api.add_namespace(calculations_ns, path='/api/calculations')
-api.add_namespace(scenarios_ns, path='/api/scenarios')
-api.add_namespace(reports_ns, path='/api/reports')
-api.add_namespace(auth_ns, path='/api/auth')
-api.add_namespace(analytics_ns, path='/api/analytics')
-
-# Define data models for request/response documentation
-roi_calculation_request = api.model('ROICalculationRequest', {
-    'project_type': fields.String(required=True, description='Type of project', 
-                                 enum=['ecommerce_platform', 'mobile_app', 'ai_integration', 'marketing_campaign', 
-                                      'product_development', 'tech_upgrade', 'automation_system', 'cybersecurity_upgrade']),
-    'company_size': fields.String(required=True, description='Company size category',
-                                enum=['startup', 'small', 'medium', 'large', 'enterprise']),
-    'industry': fields.String(required=True, description='Target industry',
-                            enum=['fintech', 'healthtech', 'edtech', 'ecommerce', 'saas', 'gaming', 
-                                 'realestate', 'foodbeverage', 'manufacturing', 'logistics']),
-    'investment_amount': fields.Float(required=True, description='Initial investment amount', min=1000, max=100000000),
-    'timeline_months': fields.Integer(required=True, description='Project timeline in months', min=1, max=120),
-    'risk_tolerance': fields.Integer(required=False, description='Risk tolerance (0-100)', min=0, max=100, default=50),
-    'currency': fields.String(required=False, description='Currency code', default='USD',
-                            enum=['USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD', 'CHF', 'CNY', 'INR', 'KRW', 'SGD', 'HKD', 'BTC', 'ETH']),
-    'market_conditions': fields.String(required=False, description='Current market conditions', 
-                                     enum=['bullish', 'neutral', 'bearish'], default='neutral'),
-    'custom_parameters': fields.Raw(required=False, description='Additional custom parameters')
-})
+    ''')
 
-roi_calculation_response = api.model('ROICalculationResponse', {
-    'success': fields.Boolean(description='Request success status'),
-    'roi_percentage': fields.Float(description='Calculated ROI percentage'),
-    'total_investment': fields.Float(description='Total investment amount'),
-    'projected_revenue': fields.Float(description='Projected revenue'),
-    'net_profit': fields.Float(description='Net profit amount'),
-    'payback_period_months': fields.Integer(description='Payback period in months'),
-    'break_even_point': fields.Float(description='Break-even point'),
-    'risk_score': fields.Float(description='Risk assessment score (0-100)'),
-    'confidence_level': fields.Float(description='Confidence level percentage'),
-    'currency': fields.String(description='Currency code'),
-    'calculation_date': fields.DateTime(description='Calculation timestamp'),
-    'scenario_analysis': fields.Raw(description='Detailed scenario analysis results'),
-    'cash_flow_projection': fields.List(fields.Raw, description='Monthly cash flow projections'),
-    'sensitivity_analysis': fields.Raw(description='Sensitivity analysis results')
+# Allowed values for enum fields; frozensets give O(1) membership checks
+PROJECT_TYPES = frozenset({
+    'ecommerce_platform', 'mobile_app', 'ai_integration', 'marketing_campaign',
+    'product_development', 'tech_upgrade', 'automation_system', 'cybersecurity_upgrade'
 })
-
-scenario_analysis_request = api.model('ScenarioAnalysisRequest', {
-    'base_parameters': fields.Nested(roi_calculation_request, required=True, description='Base calculation parameters'),
-    'scenario_type': fields.String(required=True, description='Type of scenario analysis',
-                                 enum=['monte_carlo', 'sensitivity', 'stress_test', 'what_if']),
-    'iterations': fields.Integer(required=False, description='Number of Monte Carlo iterations', min=1000, max=100000, default=10000),
-    'confidence_levels': fields.List(fields.Float, required=False, description='Confidence levels for analysis', default=[0.9, 0.95, 0.99]),
-    'variable_ranges': fields.Raw(required=False, description='Ranges for variable sensitivity analysis')
+COMPANY_SIZES = frozenset({'startup', 'small', 'medium', 'large', 'enterprise'})
+INDUSTRIES = frozenset({
+    'fintech', 'healthtech', 'edtech', 'ecommerce', 'saas', 'gaming',
+    'realestate', 'foodbeverage', 'manufacturing', 'logistics'
 })
-
-report_generation_request = api.model('ReportGenerationRequest', {
-    'calculation_results': fields.Raw(required=True, description='ROI calculation results to include in report'),
-    'report_type': fields.String(required=True, description='Type of report to generate',
-                                enum=['executive_summary', 'detailed_analysis', 'investor_presentation', 'technical_report']),
-    'format': fields.String(required=True, description='Output format',
-                          enum=['pdf', 'excel', 'powerpoint', 'html', 'json']),
-    'branding': fields.Raw(required=False, description='Custom branding options'),
-    'include_charts': fields.Boolean(required=False, description='Include visualization charts', default=True),
-    'include_raw_data': fields.Boolean(required=False, description='Include raw calculation data', default=False)
+CURRENCIES = frozenset({
+    'USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD', 'CHF', 'CNY', 'INR', 'KRW', 'SGD', 'HKD', 'BTC', 'ETH'
 })
+MARKET_CONDITIONS = frozenset({'bullish', 'neutral', 'bearish'})
+SCENARIO_TYPES = frozenset({'monte_carlo', 'sensitivity', 'stress_test', 'what_if'})
+REPORT_TYPES = frozenset({'executive_summary', 'detailed_analysis', 'investor_presentation', 'technical_report'})
+REPORT_FORMATS = frozenset({'pdf', 'excel', 'powerpoint', 'html', 'json'})
 
-auth_login_request = api.model('AuthLoginRequest', {
-    'email': fields.String(required=True, description='User email address'),
-    'password': fields.String(required=True, description='User password'),
-    'remember_me': fields.Boolean(required=False, description='Remember login session', default=False)
-})
+@lru_cache(maxsize=None)
+def _enum_values(allowed):
+    """OpenAPI requires enums as arrays; sort each set once for stable output"""
+    return sorted(allowed)
 
-auth_response = api.model('AuthResponse', {
-    'success': fields.Boolean(description='Authentication success status'),
-    'access_token': fields.String(description='JWT access token'),
-    'refresh_token': fields.String(description='JWT refresh token'),
-    'expires_in': fields.Integer(description='Token expiration time in seconds'),
-    'user_info': fields.Raw(description='User profile information'),
-    'subscription_tier': fields.String(description='User subscription tier')
-})
+# JSON-schema fragments per model, keyed by (name, id(model))
+_model_schema_cache = {}
 
-error_response = api.model('ErrorResponse', {
-    'success': fields.Boolean(description='Request success status', default=False),
-    'error': fields.String(description='Error type'),
-    'message': fields.String(description='Human-readable error message'),
-    'code': fields.Integer(description='HTTP status code'),
-    'details': fields.Raw(description='Additional error details'),
-    'timestamp': fields.DateTime(description='Error timestamp')
-})
+class CachedSchemaModel(Model):
+    """Model whose JSON-schema fragment is built once per process
+    
+    Flask-RESTx rebuilds a model's schema on every access, including each
+    payload validation. Models are never mutated after _build_api(), so the
+    first result can be reused for the life of the process.
+    """
+    
+    @property
+    def __schema__(self):
+        key = (self.name, id(self))
+        schema = _model_schema_cache.get(key)
+        if schema is None:
+            schema = _model_schema_cache[key] = Model.__schema__.fget(self)
+        return schema
+
+def _cached_model(api, name, model_fields):
+    """Register a CachedSchemaModel on the Api (drop-in for api.model)"""
+    return api.add_model(name, CachedSchemaModel(name, model_fields))
+
+# Swagger UI is loaded from the CDN instead of the bundled restx_doc static files
+SWAGGER_UI_CDN = 'https://cdn.jsdelivr.net/npm/swagger-ui-dist@5'
+
+SWAGGER_UI_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>%(title)s</title>
+    <link rel="stylesheet" type="text/css" href="%(cdn)s/swagger-ui.css" />
+    <link rel="icon" type="image/png" href="%(cdn)s/favicon-32x32.png" sizes="32x32" />
+    <style>html { box-sizing: border-box; overflow-y: scroll; } *, *:before, *:after { box-sizing: inherit; } body { margin: 0; background: #fafafa; }</style>
+</head>
+<body>
+    <div id="swagger-ui"></div>
+    <script src="%(cdn)s/swagger-ui-bundle.js" crossorigin></script>
+    <script src="%(cdn)s/swagger-ui-standalone-preset.js" crossorigin></script>
+    <script type="text/javascript">
+        window.onload = function() {
+            window.ui = SwaggerUIBundle({
+                url: %(specs_url)s,
+                dom_id: "#swagger-ui",
+                presets: [SwaggerUIBundle.presets.apis, SwaggerUIStandalonePreset.slice(1)],
+                plugins: [SwaggerUIBundle.plugins.DownloadUrl],
+                validatorUrl: null,
+                docExpansion: "none",
+                defaultModelRendering: "model",
+                syntaxHighlight: false
+            });
+        };
+    </script>
+</body>
+</html>
+"""
+
+@lru_cache(maxsize=16)
+def _swagger_ui_page(title, specs_url):
+    """Render the Swagger UI page once per specs URL"""
+    return SWAGGER_UI_PAGE % {
+        'title': html.escape(title),
+        'cdn': SWAGGER_UI_CDN,
+        'specs_url': json.dumps(specs_url)
+    }
+
+# Create API documentation blueprint
+api_bp = Blueprint('api_docs', __name__)
 
 # Authentication decorator for documentation
 def require_auth(f):
-    """Decorator to mark endpoints as requiring authentication"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        return f(*args, **kwargs)
-    return decorated_function
-
-# ROI Calculations Namespace
-@calculations_ns.route('/roi')
-class ROICalculation(Resource):
-    @calculations_ns.doc('calculate_roi')
-    @calculations_ns.expect(roi_calculation_request)
-    @calculations_ns.marshal_with(roi_calculation_response)
-    @calculations_ns.response(200, 'Success', roi_calculation_response)
-    @calculations_ns.response(400, 'Validation Error', error_response)
-    @calculations_ns.response(401, 'Unauthorized', error_response)
-    @calculations_ns.response(429, 'Rate Limit Exceeded', error_response)
-    @require_auth
-    def post(self):
-        """
-        **Calculate ROI with Advanced Financial Modeling**
+    """Decorator to mark endpoints as requiring authentication
+    
+    Only tags the view; it adds no wrapper so the call path is unchanged.
+    """
+    f._requires_auth = True
+    return f
+
+def _compile_marshaller(model):
+    """Build a dict builder for a response model, resolved once up front
+    
+    Unlike Flask-RESTx's marshal(), values are copied as-is without per-field
+    output()/format() dispatch, so callers must pass JSON-ready values.
+    None values are dropped (skip_none) and nested models are compiled too.
+    """
+    keys = tuple(model.keys())
+    nested = {
+        key: _compile_marshaller(field.nested)
+        for key, field in model.items()
+        if isinstance(field, fields.Nested)
+    }
+    
+    def marshaller(obj):
+        result = {}
+        for key in keys:
+            value = obj.get(key)
+            if value is None:
+                continue
+            if key in nested:
+                value = nested[key](value)
+            result[key] = value
+        return result
+    
+    return marshaller
+
+def _marshal_compiled(model):
+    """Lightweight marshal_with() replacement for small, hot response models"""
+    marshaller = _compile_marshaller(model)
+    
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            rv = f(*args, **kwargs)
+            if isinstance(rv, tuple):
+                return (marshaller(rv[0] or {}),) + rv[1:]
+            return marshaller(rv or {})
+        return wrapper
+    return decorator
+
+def _plain_get_view(resource):
+    """Mark a read-only Resource to be served by a plain Flask view
+    
+    The Resource stays registered so it keeps owning the swagger
+    documentation; init_api_docs() swaps its view function for one that calls
+    get() directly, skipping dispatch_request() and representation
+    negotiation. Only use it for GET handlers without expect/marshal decorators.
+    """
+    resource.plain_get_view = True
+    return resource
+
+def _make_plain_view(resource, api):
+    """Build a plain Flask view around a shared instance of resource"""
+    handler = resource(api).get
+    
+    def view(**kwargs):
+        rv = handler(**kwargs)
+        if isinstance(rv, tuple):
+            return output_json(*rv)
+        return output_json(rv, 200)
+    view.__name__ = resource.endpoint
+    view.__doc__ = handler.__doc__
+    return view
+
+def _compile_field_check(key, field):
+    """Build the type/range/enum check for one request model field"""
+    if isinstance(field, fields.Nested):
+        validate_nested = _compile_validator(field.nested)
         
-        Performs comprehensive ROI analysis using industry benchmarks, risk assessment, 
-        and advanced financial modeling techniques.
+        def check_nested(value):
+            if not isinstance(value, dict):
+                raise ValidationError(f"{key} must be an object", key, value, 'invalid_type')
+            validate_nested(value)
         
-        **Features:**
-        - Real industry data and benchmarks
-        - Monte Carlo risk simulations  
-        - Currency conversion support
-        - Company size and industry adjustments
-        - Sensitivity analysis
-        - Cash flow projections
+        return check_nested
+    if isinstance(field, fields.Integer):
+        types, type_name = (int,), 'an integer'
+    elif isinstance(field, fields.Float):
+        types, type_name = (int, float), 'a number'
+    elif isinstance(field, fields.String):
+        types, type_name = (str,), 'a string'
+    else:
+        return None
+    
+    minimum = getattr(field, 'minimum', None)
+    maximum = getattr(field, 'maximum', None)
+    enum = frozenset(field.enum) if getattr(field, 'enum', None) else None
+    
+    def check(value):
+        if isinstance(value, bool) or not isinstance(value, types):
+            raise ValidationError(f"{key} must be {type_name}", key, value, 'invalid_type')
+        if minimum is not None and value < minimum:
+            raise ValidationError(f"{key} must be at least {minimum}", key, value, 'out_of_range')
+        if maximum is not None and value > maximum:
+            raise ValidationError(f"{key} must be at most {maximum}", key, value, 'out_of_range')
+        if enum is not None and value not in enum:
+            raise ValidationError(f"{key} must be one of: {', '.join(sorted(enum))}", key, value, 'invalid_choice')
+    
+    return check
+
+def _compile_validator(model):
+    """Build a payload validator for a request model, resolved once up front
+    
+    Replaces Flask-RESTx's jsonschema validation on hot endpoints: each field's
+    type, min/max and enum checks are bound into closures when the Api is built.
+    """
+    required = tuple(key for key, field in model.items() if field.required)
+    checks = tuple(
+        (key, check) for key, check in
+        ((key, _compile_field_check(key, field)) for key, field in model.items())
+        if check is not None
+    )
+    
+    def validate(payload):
+        if not isinstance(payload, dict):
+            raise ValidationError("Request body must be a JSON object", code='invalid_body')
+        for key in required:
+            if payload.get(key) is None:
+                raise ValidationError(f"{key} is required", key, code='required')
+        for key, check in checks:
+            value = payload.get(key)
+            if value is not None:
+                check(value)
+    
+    return validate
+
+def _validate_payload(validator, many=False):
+    """Run a compiled validator on the JSON body before the handler"""
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            payload = request.get_json(silent=True)
+            if many:
+                if not isinstance(payload, list):
+                    raise ValidationError("Request body must be a JSON array", code='invalid_body')
+                for item in payload:
+                    validator(item)
+            else:
+                validator(payload)
+            return f(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# Encoded responses for identical calculation requests
+response_cache = SimpleCache(default_ttl=3600)
+
+def _canonical_cache_key(endpoint, params):
+    """Hash the endpoint and its parameters with keys sorted"""
+    if ORJSON_AVAILABLE:
+        encoded = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    else:
+        encoded = json.dumps(params, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.blake2b(endpoint.encode('utf-8') + b'|' + encoded, digest_size=16).hexdigest()
+
+def _cache_response(ttl=3600):
+    """Serve repeated identical requests from response_cache
+    
+    Sits above marshal_with so a hit skips the calculation and marshalling;
+    only 200 responses are stored.
+    """
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            params = request.get_json(silent=True) or {}
+            mediatype = request.accept_mimetypes.best_match(RESPONSE_ENCODERS, 'application/json')
+            # The X-Fields mask and media type change the body, so they are part of the key
+            endpoint = f"{request.endpoint}|{request.headers.get('X-Fields', '')}|{mediatype}"
+            key = _canonical_cache_key(endpoint, params)
+            
+            body = response_cache.get(key)
+            if body is None:
+                rv = f(*args, **kwargs)
+                data, code = (rv[0], rv[1]) if isinstance(rv, tuple) else (rv, 200)
+                if code != 200:
+                    return rv
+                body = RESPONSE_ENCODERS[mediatype](data)
+                response_cache.set(key, body, ttl)
+            return Response(body, mimetype=mediatype)
+        return wrapper
+    return decorator
+
+@lru_cache(maxsize=1)
+def _build_api():
+    """Construct the Flask-RESTx Api, namespaces, models and resources on first use
+    
+    Workers that never serve the documentation never pay for building
+    the Swagger model tree at import time.
+    """
+    # Initialize Flask-RESTx API with professional configuration
+    api = Api(
+        api_bp,
+        version='2.0',
+        title='VoidSight Analytics API',
+        description=API_DESCRIPTION,
+        doc='/docs/',
+        authorizations={
+            'Bearer': {
+                'type': 'apiKey',
+                'in': 'header',
+                'name': 'Authorization',
+                'description': 'JWT Authorization header using the Bearer scheme. Example: "Authorization: Bearer {token}"'
+            }
+        },
+        security='Bearer'
+    )
+    api.representations['application/json'] = output_json
+    if MSGPACK_AVAILABLE:
+        api.representations['application/msgpack'] = output_msgpack
+
+    @api.documentation
+    def swagger_ui():
+        """Serve the CDN-backed Swagger UI with operations collapsed"""
+        return Response(_swagger_ui_page(api.title, api.specs_url), mimetype='text/html')
+
+    # Define namespaces for organized documentation. They only group the swagger
+    # tags: every route lands directly in the blueprint's URL map, and Flask-RESTx
+    # always tags an operation with its namespace name.
+    calculations_ns = Namespace('calculations', description='ROI calculation operations')
+    scenarios_ns = Namespace('scenarios', description='Scenario analysis and what-if modeling')
+    reports_ns = Namespace('reports', description='Professional report generation')
+    auth_ns = Namespace('auth', description='Authentication and user management')
+    analytics_ns = Namespace('analytics', description='Advanced analytics and insights')
+
+    api.add_namespace(calculations_ns, path='/api/calculations')
+    api.add_namespace(scenarios_ns, path='/api/scenarios')
+    api.add_namespace(reports_ns, path='/api/reports')
+    api.add_namespace(auth_ns, path='/api/auth')
+    api.add_namespace(analytics_ns, path='/api/analytics')
+
+    # Define data models for request/response documentation
+    roi_calculation_request = _cached_model(api, 'ROICalculationRequest', {
+        'project_type': fields.String(required=True, description='Type of project', 
+                                     enum=_enum_values(PROJECT_TYPES)),
+        'company_size': fields.String(required=True, description='Company size category',
+                                    enum=_enum_values(COMPANY_SIZES)),
+        'industry': fields.String(required=True, description='Target industry',
+                                enum=_enum_values(INDUSTRIES)),
+        'investment_amount': fields.Float(required=True, description='Initial investment amount', min=1000, max=100000000),
+        'timeline_months': fields.Integer(required=True, description='Project timeline in months', min=1, max=120),
+        'risk_tolerance': fields.Integer(required=False, description='Risk tolerance (0-100)', min=0, max=100, default=50),
+        'currency': fields.String(required=False, description='Currency code', default='USD',
+                                enum=_enum_values(CURRENCIES)),
+        'market_conditions': fields.String(required=False, description='Current market conditions', 
+                                         enum=_enum_values(MARKET_CONDITIONS), default='neutral'),
+        'custom_parameters': fields.Raw(required=False, description='Additional custom parameters')
+    })
+
+    validate_roi_request = _compile_validator(roi_calculation_request)
+
+    cash_flow_entry = _cached_model(api, 'CashFlowEntry', {
+        'month': fields.Integer(description='Month number (0 = initial investment)'),
+        'revenue': fields.Float(description='Revenue for the month'),
+        'costs': fields.Float(description='Costs for the month'),
+        'net_cash_flow': fields.Float(description='Net cash flow for the month'),
+        'cumulative_cash_flow': fields.Float(description='Cumulative cash flow to date')
+    })
+
+    scenario_outcome = _cached_model(api, 'ScenarioOutcome', {
+        'scenario_id': fields.String(description='Scenario identifier'),
+        'roi_percentage': fields.Float(description='Scenario ROI percentage'),
+        'npv': fields.Float(description='Scenario net present value'),
+        'payback_months': fields.Integer(description='Scenario payback period in months'),
+        'risk_score': fields.Float(description='Scenario risk score (0-100)'),
+        'market_condition': fields.String(description='Simulated market condition'),
+        'confidence': fields.Float(description='Scenario confidence (0-1)')
+    })
+
+    risk_distribution = _cached_model(api, 'RiskDistribution', {
+        'low_risk': fields.Float(description='Percentage of low-risk scenarios'),
+        'medium_risk': fields.Float(description='Percentage of medium-risk scenarios'),
+        'high_risk': fields.Float(description='Percentage of high-risk scenarios')
+    })
+
+    scenario_analysis = _cached_model(api, 'ScenarioAnalysis', {
+        'total_scenarios': fields.Integer(description='Number of simulated scenarios'),
+        'best_case': fields.Nested(scenario_outcome, skip_none=True, description='Best-case scenario'),
+        'worst_case': fields.Nested(scenario_outcome, skip_none=True, description='Worst-case scenario'),
+        'most_likely': fields.Nested(scenario_outcome, skip_none=True, description='Median scenario'),
+        'average_roi': fields.Float(description='Average ROI across scenarios'),
+        'median_roi': fields.Float(description='Median ROI across scenarios'),
+        'success_probability': fields.Float(description='Percentage of scenarios with positive ROI'),
+        'risk_distribution': fields.Nested(risk_distribution, skip_none=True, description='Scenario risk distribution')
+    })
+
+    sensitivity_analysis = _cached_model(api, 'SensitivityAnalysis', {
+        'growth_rate': fields.List(fields.Float, description='ROI at -20%, -10%, 0, +10%, +20% growth rate'),
+        'roi_potential': fields.List(fields.Float, description='ROI at -20%, -10%, 0, +10%, +20% ROI potential'),
+        'timeline': fields.List(fields.Float, description='ROI at -20%, -10%, 0, +10%, +20% timeline')
+    })
+
+    roi_calculation_response = _cached_model(api, 'ROICalculationResponse', {
+        'success': fields.Boolean(description='Request success status'),
+        'roi_percentage': fields.Float(description='Calculated ROI percentage'),
+        'total_investment': fields.Float(description='Total investment amount'),
+        'projected_revenue': fields.Float(description='Projected revenue'),
+        'net_profit': fields.Float(description='Net profit amount'),
+        'payback_period_months': fields.Integer(description='Payback period in months'),
+        'break_even_point': fields.Float(description='Break-even point'),
+        'risk_score': fields.Float(description='Risk assessment score (0-100)'),
+        'confidence_level': fields.Float(description='Confidence level percentage'),
+        'currency': fields.String(description='Currency code'),
+        'calculation_date': fields.DateTime(description='Calculation timestamp'),
+        'scenario_analysis': fields.Nested(scenario_analysis, skip_none=True, description='Detailed scenario analysis results'),
+        'cash_flow_projection': fields.List(fields.Nested(cash_flow_entry, skip_none=True), description='Monthly cash flow projections'),
+        'sensitivity_analysis': fields.Nested(sensitivity_analysis, skip_none=True, description='Sensitivity analysis results')
+    })
+
+    # Nested fields are emitted as $ref pointers into definitions, never inlined
+    scenario_analysis_request = _cached_model(api, 'ScenarioAnalysisRequest', {
+        'base_parameters': fields.Nested(roi_calculation_request, required=True, description='Base calculation parameters'),
+        'scenario_type': fields.String(required=True, description='Type of scenario analysis',
+                                     enum=_enum_values(SCENARIO_TYPES)),
+        'iterations': fields.Integer(required=False, description='Number of Monte Carlo iterations', min=1000, max=100000, default=10000),
+        'confidence_levels': fields.List(fields.Float, required=False, description='Confidence levels for analysis', default=[0.9, 0.95, 0.99]),
+        'variable_ranges': fields.Raw(required=False, description='Ranges for variable sensitivity analysis')
+    })
+
+    validate_scenario_request = _compile_validator(scenario_analysis_request)
+
+    report_generation_request = _cached_model(api, 'ReportGenerationRequest', {
+        'calculation_results': fields.Raw(required=True, description='ROI calculation results to include in report'),
+        'report_type': fields.String(required=True, description='Type of report to generate',
+                                    enum=_enum_values(REPORT_TYPES)),
+        'format': fields.String(required=True, description='Output format',
+                              enum=_enum_values(REPORT_FORMATS)),
+        'branding': fields.Raw(required=False, description='Custom branding options'),
+        'include_charts': fields.Boolean(required=False, description='Include visualization charts', default=True),
+        'include_raw_data': fields.Boolean(required=False, description='Include raw calculation data', default=False)
+    })
+
+    auth_login_request = _cached_model(api, 'AuthLoginRequest', {
+        'email': fields.String(required=True, description='User email address'),
+        'password': fields.String(required=True, description='User password'),
+        'remember_me': fields.Boolean(required=False, description='Remember login session', default=False)
+    })
+
+    user_info = _cached_model(api, 'UserInfo', {
+        'id': fields.String(description='User identifier'),
+        'email': fields.String(description='User email address'),
+        'username': fields.String(description='Username'),
+        'full_name': fields.String(description='Full name'),
+        'company_name': fields.String(description='Company name'),
+        'subscription_tier': fields.String(description='User subscription tier'),
+        'is_trial_active': fields.Boolean(description='Whether the trial period is active'),
+        'is_subscription_active': fields.Boolean(description='Whether the subscription is active'),
+        'calculations_used': fields.Integer(description='Calculations used in the current period'),
+        'created_at': fields.DateTime(description='Account creation timestamp'),
+        'limits': fields.Raw(description='Subscription tier limits')
+    })
+
+    auth_response = _cached_model(api, 'AuthResponse', {
+        'success': fields.Boolean(description='Authentication success status'),
+        'access_token': fields.String(description='JWT access token'),
+        'refresh_token': fields.String(description='JWT refresh token'),
+        'expires_in': fields.Integer(description='Token expiration time in seconds'),
+        'user_info': fields.Nested(user_info, skip_none=True, description='User profile information'),
+        'subscription_tier': fields.String(description='User subscription tier')
+    })
+
+    error_response = _cached_model(api, 'ErrorResponse', {
+        'success': fields.Boolean(description='Request success status', default=False),
+        'error': fields.String(description='Error type'),
+        'message': fields.String(description='Human-readable error message'),
+        'code': fields.Integer(description='HTTP status code'),
+        'details': fields.Raw(description='Additional error details'),
+        'timestamp': fields.DateTime(description='Error timestamp')
+    })
+
+    marshal_error = _compile_marshaller(error_response)
+
+    # ROI Calculations Namespace
+    @calculations_ns.route('/roi')
+    class ROICalculation(Resource):
+        @calculations_ns.doc('calculate_roi')
+        @calculations_ns.expect(roi_calculation_request)
+        @_validate_payload(validate_roi_request)
+        @_cache_response()
+        @calculations_ns.marshal_with(roi_calculation_response, skip_none=True)
+        @calculations_ns.response(200, 'Success', roi_calculation_response)
+        @calculations_ns.response(400, 'Validation Error', error_response)
+        @calculations_ns.response(401, 'Unauthorized', error_response)
+        @calculations_ns.response(429, 'Rate Limit Exceeded', error_response)
+        @require_auth
+        def post(self):
+            """
+            **Calculate ROI with Advanced Financial Modeling**
         
-        **Example Request:**
-        ```json
-        {
-            "project_type": "ecommerce_platform",
-            "company_size": "medium", 
-            "industry": "retail",
-            "investment_amount": 50000,
-            "timeline_months": 12,
-            "risk_tolerance": 60,
-            "currency": "USD"
-        }
-        ```
-        """
-        pass
-
-@calculations_ns.route('/batch')
-class BatchROICalculation(Resource):
-    @calculations_ns.doc('batch_calculate_roi')
-    @calculations_ns.expect([roi_calculation_request])
-    @calculations_ns.marshal_with([roi_calculation_response])
-    @require_auth
-    def post(self):
-        """
-        **Batch ROI Calculations**
+            Performs comprehensive ROI analysis using industry benchmarks, risk assessment, 
+            and advanced financial modeling techniques.
         
-        Calculate ROI for multiple projects simultaneously. Useful for portfolio analysis
-        and comparing multiple investment opportunities.
+            **Features:**
+            - Real industry data and benchmarks
+            - Monte Carlo risk simulations  
+            - Currency conversion support
+            - Company size and industry adjustments
+            - Sensitivity analysis
+            - Cash flow projections
         
-        **Limits:**
-        - Free tier: 5 calculations per batch
-        - Professional: 25 calculations per batch
-        - Enterprise: 100 calculations per batch
-        """
-        pass
-
-# Scenario Analysis Namespace
-@scenarios_ns.route('/monte-carlo')
-class MonteCarloAnalysis(Resource):
-    @scenarios_ns.doc('monte_carlo_analysis')
-    @scenarios_ns.expect(scenario_analysis_request)
-    @scenarios_ns.marshal_with(roi_calculation_response)
-    @require_auth
-    def post(self):
-        """
-        **Monte Carlo Scenario Analysis**
+            **Example Request:**
+            ```json
+            {
+                "project_type": "ecommerce_platform",
+                "company_size": "medium", 
+                "industry": "retail",
+                "investment_amount": 50000,
+                "timeline_months": 12,
+                "risk_tolerance": 60,
+                "currency": "USD"
+            }
+            ```
+            """
+            pass
+
+    @calculations_ns.route('/batch')
+    class BatchROICalculation(Resource):
+        @calculations_ns.doc('batch_calculate_roi')
+        @calculations_ns.expect([roi_calculation_request])
+        @_validate_payload(validate_roi_request, many=True)
+        @calculations_ns.marshal_with([roi_calculation_response], skip_none=True)
+        @require_auth
+        def post(self):
+            """
+            **Batch ROI Calculations**
         
-        Advanced probabilistic analysis using Monte Carlo simulations to model
-        uncertainty and risk in ROI projections.
+            Calculate ROI for multiple projects simultaneously. Useful for portfolio analysis
+            and comparing multiple investment opportunities.
         
-        **Features:**
-        - Configurable iteration count (1,000 - 100,000)
-        - Multiple confidence intervals
-        - Risk distribution analysis
-        - Stress testing scenarios
-        """
-        pass
-
-@scenarios_ns.route('/sensitivity')
-class SensitivityAnalysis(Resource):
-    @scenarios_ns.doc('sensitivity_analysis')
-    @scenarios_ns.expect(scenario_analysis_request)
-    @require_auth
-    def post(self):
-        """
-        **Sensitivity Analysis**
+            **Limits:**
+            - Free tier: 5 calculations per batch
+            - Professional: 25 calculations per batch
+            - Enterprise: 100 calculations per batch
+            
+            For large batches prefer `/batch/stream`, which streams results as NDJSON.
+            """
+            pass
+
+    @calculations_ns.route('/batch/stream')
+    class BatchROICalculationStream(Resource):
+        @calculations_ns.doc('batch_calculate_roi_stream')
+        @calculations_ns.produces(['application/x-ndjson'])
+        @require_auth
+        def post(self):
+            """
+            **Streaming Batch ROI Calculations (NDJSON)**
+            
+            Send one `ROICalculationRequest` JSON object per line
+            (`Content-Type: application/x-ndjson`). Each result is written back as
+            one `ROICalculationResponse` line as soon as it is calculated, so neither
+            the request nor the response batch is held in memory.
+            
+            A line that fails validation or calculation is answered with an
+            `ErrorResponse` line; the remaining lines are still processed.
+            """
+            results = _stream_batch_results(request.stream, validate_roi_request,
+                                            roi_calculation_response, marshal_error)
+            return Response(stream_with_context(results), mimetype='application/x-ndjson')
+
+    # Scenario Analysis Namespace
+    @scenarios_ns.route('/monte-carlo')
+    class MonteCarloAnalysis(Resource):
+        @scenarios_ns.doc('monte_carlo_analysis')
+        @scenarios_ns.expect(scenario_analysis_request)
+        @_validate_payload(validate_scenario_request)
+        @_cache_response()
+        @scenarios_ns.marshal_with(roi_calculation_response, skip_none=True)
+        @require_auth
+        def post(self):
+            """
+            **Monte Carlo Scenario Analysis**
         
-        Analyze how changes in key variables affect ROI outcomes.
-        Identifies the most critical factors for project success.
-        """
-        pass
-
-@scenarios_ns.route('/what-if')
-class WhatIfAnalysis(Resource):
-    @scenarios_ns.doc('what_if_analysis')
-    @scenarios_ns.expect(scenario_analysis_request)
-    @require_auth
-    def post(self):
-        """
-        **What-If Analysis**
+            Advanced probabilistic analysis using Monte Carlo simulations to model
+            uncertainty and risk in ROI projections.
         
-        Explore different scenarios by varying investment amounts,
-        timelines, and market conditions.
-        """
-        pass
-
-# Reports Namespace
-@reports_ns.route('/generate')
-class ReportGeneration(Resource):
-    @reports_ns.doc('generate_report')
-    @reports_ns.expect(report_generation_request)
-    @require_auth
-    def post(self):
-        """
-        **Generate Professional Reports**
+            **Features:**
+            - Configurable iteration count (1,000 - 100,000)
+            - Multiple confidence intervals
+            - Risk distribution analysis
+            - Stress testing scenarios
+            """
+            payload = api.payload
+            result = _calculate_roi_item(payload['base_parameters'])
+            result['scenario_analysis'] = run_monte_carlo(
+                payload['base_parameters'], payload.get('iterations') or 10000
+            )
+            return result
+
+    @scenarios_ns.route('/sensitivity')
+    class SensitivityAnalysis(Resource):
+        @scenarios_ns.doc('sensitivity_analysis')
+        @scenarios_ns.expect(scenario_analysis_request)
+        @require_auth
+        def post(self):
+            """
+            **Sensitivity Analysis**
         
-        Create professionally formatted reports in multiple formats
-        including PDF, Excel, and PowerPoint presentations.
+            Analyze how changes in key variables affect ROI outcomes.
+            Identifies the most critical factors for project success.
+            """
+            pass
+
+    @scenarios_ns.route('/what-if')
+    class WhatIfAnalysis(Resource):
+        @scenarios_ns.doc('what_if_analysis')
+        @scenarios_ns.expect(scenario_analysis_request)
+        @require_auth
+        def post(self):
+            """
+            **What-If Analysis**
         
-        **Report Types:**
-        - Executive Summary: High-level overview for stakeholders
-        - Detailed Analysis: Complete technical analysis
-        - Investor Presentation: Pitch-ready presentation
-        - Technical Report: Full methodology and calculations
-        """
-        pass
-
-@reports_ns.route('/templates')
-class ReportTemplates(Resource):
-    @reports_ns.doc('list_report_templates')
-    @require_auth
-    def get(self):
-        """
-        **List Available Report Templates**
+            Explore different scenarios by varying investment amounts,
+            timelines, and market conditions.
+            """
+            pass
+
+    # Reports Namespace
+    @reports_ns.route('/generate')
+    class ReportGeneration(Resource):
+        @reports_ns.doc('generate_report')
+        @reports_ns.expect(report_generation_request)
+        @require_auth
+        def post(self):
+            """
+            **Generate Professional Reports**
         
-        Get a list of available report templates and customization options.
-        """
-        pass
-
-# Authentication Namespace
-@auth_ns.route('/login')
-class AuthLogin(Resource):
-    @auth_ns.doc('user_login')
-    @auth_ns.expect(auth_login_request)
-    @auth_ns.marshal_with(auth_response)
-    @auth_ns.response(200, 'Login successful', auth_response)
-    @auth_ns.response(401, 'Invalid credentials', error_response)
-    def post(self):
-        """
-        **User Authentication**
+            Create professionally formatted reports in multiple formats
+            including PDF, Excel, and PowerPoint presentations.
         
-        Authenticate user and receive JWT tokens for API access.
-        """
-        pass
-
-@auth_ns.route('/refresh')
-class AuthRefresh(Resource):
-    @auth_ns.doc('refresh_token')
-    @auth_ns.marshal_with(auth_response)
-    @require_auth
-    def post(self):
-        """
-        **Refresh Access Token**
+            **Report Types:**
+            - Executive Summary: High-level overview for stakeholders
+            - Detailed Analysis: Complete technical analysis
+            - Investor Presentation: Pitch-ready presentation
+            - Technical Report: Full methodology and calculations
+            """
+            pass
+
+    @reports_ns.route('/templates')
+    @_plain_get_view
+    class ReportTemplates(Resource):
+        @reports_ns.doc('list_report_templates')
+        @require_auth
+        def get(self):
+            """
+            **List Available Report Templates**
         
-        Refresh expired access token using refresh token.
-        """
-        pass
-
-@auth_ns.route('/profile')
-class UserProfile(Resource):
-    @auth_ns.doc('get_user_profile')
-    @require_auth
-    def get(self):
-        """
-        **Get User Profile**
+            Get a list of available report templates and customization options.
+            """
+            pass
+
+    # Authentication Namespace
+    @auth_ns.route('/login')
+    class AuthLogin(Resource):
+        @auth_ns.doc('user_login')
+        @auth_ns.expect(auth_login_request)
+        @auth_ns.response(200, 'Login successful', auth_response)
+        @_marshal_compiled(auth_response)
+        @auth_ns.response(401, 'Invalid credentials', error_response)
+        def post(self):
+            """
+            **User Authentication**
         
-        Retrieve current user profile and subscription information.
-        """
-        pass
-
-# Analytics Namespace
-@analytics_ns.route('/dashboard')
-class AnalyticsDashboard(Resource):
-    @analytics_ns.doc('analytics_dashboard')
-    @require_auth
-    def get(self):
-        """
-        **Analytics Dashboard Data**
+            Authenticate user and receive JWT tokens for API access.
+            """
+            pass
+
+    @auth_ns.route('/refresh')
+    class AuthRefresh(Resource):
+        @auth_ns.doc('refresh_token')
+        @auth_ns.response(200, 'Success', auth_response)
+        @_marshal_compiled(auth_response)
+        @require_auth
+        def post(self):
+            """
+            **Refresh Access Token**
         
-        Get aggregated analytics and insights for dashboard display.
-        """
-        pass
-
-@analytics_ns.route('/usage')
-class UsageAnalytics(Resource):
-    @analytics_ns.doc('usage_analytics')
-    @require_auth
-    def get(self):
-        """
-        **Usage Analytics**
+            Refresh expired access token using refresh token.
+            """
+            pass
+
+    @auth_ns.route('/profile')
+    @_plain_get_view
+    class UserProfile(Resource):
+        @auth_ns.doc('get_user_profile')
+        @require_auth
+        def get(self):
+            """
+            **Get User Profile**
         
-        Get API usage statistics and billing information.
-        """
-        pass
+            Retrieve current user profile and subscription information.
+            """
+            pass
+
+    # Analytics Namespace
+    @analytics_ns.route('/dashboard')
+    @_plain_get_view
+    class AnalyticsDashboard(Resource):
+        @analytics_ns.doc('analytics_dashboard')
+        @require_auth
+        def get(self):
+            """
+            **Analytics Dashboard Data**
+        
+            Get aggregated analytics and insights for dashboard display.
+            """
+            pass
+
+    @analytics_ns.route('/usage')
+    @_plain_get_view
+    class UsageAnalytics(Resource):
+        @analytics_ns.doc('usage_analytics')
+        @require_auth
+        def get(self):
+            """
+            **Usage Analytics**
+        
+            Get API usage statistics and billing information.
+            """
+            pass
+
+    # Error handlers for API documentation
+    @api.errorhandler(ValidationError)
+    def handle_validation_error(error):
+        """Handle validation errors"""
+        return marshal_error(_validation_error_body(error)), 400
+
+    @api.errorhandler(Exception)
+    def handle_exception(error):
+        """Handle general exceptions"""
+        return marshal_error(_internal_error_body()), 500
+    
+    return api
 
-# Error handlers for API documentation
-@api.errorhandler(ValidationError)
-def handle_validation_error(error):
-    """Handle validation errors"""
-    return {'message': str(error)}, 400
+@lru_cache(maxsize=1)
+def _get_calculator():
+    """Return the ROI calculator shared by every request in this process"""
+    from utils.calculator import EnhancedROICalculator
+    
+    return EnhancedROICalculator()
+
+def _calculate_roi_item(params):
+    """Run a single ROICalculationRequest through the ROI calculator"""
+    result = _get_calculator().calculate_enhanced_roi_projection(
+        investment=Decimal(str(params['investment_amount'])),
+        industry=params['industry'],
+        project_type=params['project_type'],
+        timeline_months=int(params['timeline_months']),
+        currency=params.get('currency', 'USD'),
+        company_size=params['company_size']
+    )
+    return {
+        'success': True,
+        'roi_percentage': float(result.roi_percentage),
+        'total_investment': float(result.total_investment),
+        'projected_revenue': float(result.projected_revenue),
+        'net_profit': float(result.net_profit),
+        'payback_period_months': result.payback_period_months,
+        'break_even_point': float(result.break_even_point),
+        'risk_score': float(result.risk_score),
+        'currency': result.currency,
+        'calculation_date': result.calculation_date,
+        'sensitivity_analysis': result.sensitivity_analysis
+    }
+
+def _simulate_roi_numpy(investment, growth, roi, timeline):
+    """Vectorized ROI percentages for arrays of sampled parameters"""
+    growth = np.clip(growth, 0, 0.5)
+    roi = np.maximum(roi, 0.5)
+    years = np.minimum(np.maximum(timeline, 6) / 12, 5)
+    revenue = np.minimum(investment * roi * (1 + growth * years), investment * 8)
+    return (revenue * 0.70 - investment) / investment * 100
+
+def run_monte_carlo(params, iterations=10000):
+    """Monte Carlo ROI distribution for a ROICalculationRequest
+    
+    Uses the same model as EnhancedROICalculator._monte_carlo_simulation but
+    samples every iteration at once with NumPy; without NumPy it falls back
+    to a plain loop.
+    """
+    from config import Config
+    
+    industry = Config.INDUSTRIES[params['industry']]
+    project = Config.PROJECT_TYPES[params['project_type']]
+    investment = float(params['investment_amount'])
+    timeline = float(params['timeline_months'])
+    
+    growth_mean, growth_sd = industry.get('growth_rate', 0.1), industry.get('volatility', 0.1) * 0.3
+    roi_mean, roi_sd = project.get('roi_potential', 2.0), project.get('risk_level', 0.2) * 0.5
+    
+    if NUMPY_AVAILABLE:
+        rng = np.random.default_rng()
+        results = _simulate_roi_numpy(
+            investment,
+            rng.normal(growth_mean, growth_sd, iterations),
+            rng.normal(roi_mean, roi_sd, iterations),
+            rng.normal(timeline, timeline * 0.1, iterations)
+        )
+        worst, median, best = np.percentile(results, [5, 50, 95])
+        average = results.mean()
+        losses = int(np.count_nonzero(results < 0))
+        moderate = int(np.count_nonzero(results < 100)) - losses
+    else:
+        results = []
+        for _ in range(iterations):
+            growth = min(max(0, random.gauss(growth_mean, growth_sd)), 0.5)
+            roi = max(0.5, random.gauss(roi_mean, roi_sd))
+            years = min(max(6, random.gauss(timeline, timeline * 0.1)) / 12, 5)
+            revenue = min(investment * roi * (1 + growth * years), investment * 8)
+            results.append((revenue * 0.70 - investment) / investment * 100)
+        results.sort()
+        worst, median, best = statistics.quantiles(results, n=20, method='inclusive')[0::9]
+        average = statistics.fmean(results)
+        losses = sum(1 for value in results if value < 0)
+        moderate = sum(1 for value in results if value < 100) - losses
+    
+    def outcome(scenario_id, value):
+        return {'scenario_id': scenario_id, 'roi_percentage': round(float(value), 2)}
+    
+    return {
+        'total_scenarios': iterations,
+        'best_case': outcome('p95', best),
+        'worst_case': outcome('p5', worst),
+        'most_likely': outcome('p50', median),
+        'average_roi': round(float(average), 2),
+        'median_roi': round(float(median), 2),
+        'success_probability': round((iterations - losses) / iterations * 100, 2),
+        'risk_distribution': {
+            'low_risk': round((iterations - losses - moderate) / iterations * 100, 2),
+            'medium_risk': round(moderate / iterations * 100, 2),
+            'high_risk': round(losses / iterations * 100, 2)
+        }
+    }
+
+def _validation_error_body(error):
+    """ErrorResponse fields for a ValidationError"""
+    return {
+        'success': False,
+        'error': 'validation_error',
+        'message': str(error),
+        'code': 400,
+        'details': {'field': error.field} if error.field else None,
+        'timestamp': datetime.utcnow().isoformat()
+    }
 
-@api.errorhandler(Exception)
-def handle_exception(error):
-    """Handle general exceptions"""
-    return {'message': 'Internal server error'}, 500
+def _internal_error_body():
+    """ErrorResponse fields for an unexpected exception, without its details"""
+    return {
+        'success': False,
+        'error': 'internal_error',
+        'message': 'Internal server error',
+        'code': 500,
+        'timestamp': datetime.utcnow().isoformat()
+    }
+
+def _stream_batch_results(lines, validate, response_model, marshal_error):
+    """Yield one NDJSON result line per NDJSON request line
+    
+    Each line goes through the same compiled validator as /roi; failures are
+    written as ErrorResponse lines instead of aborting the stream.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            try:
+                params = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+            except ValueError:
+                raise ValidationError("Each line must be a JSON object", code='invalid_json')
+            validate(params)
+            result = marshal(_calculate_roi_item(params), response_model, skip_none=True)
+        except ValidationError as e:
+            result = marshal_error(_validation_error_body(e))
+        except Exception:
+            logger.exception("Batch stream item failed")
+            result = marshal_error(_internal_error_body())
+        yield _dumps(result) + b'\n'
+
+# Pre-serialized swagger.json bodies, built once by init_api_docs()
+_swagger_cache = {}
+
+def _build_swagger_cache(app):
+    """Serialize the OpenAPI schema once so /swagger.json never regenerates it
+    
+    This is the only place the Resource docstrings and models are parsed into
+    operations; afterwards neither /swagger.json nor /docs/ touches them.
+    """
+    with app.test_request_context():
+        schema = _build_api().__schema__
+    
+    if 'error' in schema:
+        # Leave the default Flask-RESTx view in place so the error stays visible
+        return False
+    
+    raw = _dumps(schema)
+    _swagger_cache['raw'] = raw
+    _swagger_cache['gzip'] = gzip.compress(raw, compresslevel=6)
+    if BROTLI_AVAILABLE:
+        _swagger_cache['br'] = brotli.compress(raw, quality=5)
+    _swagger_cache['etag'] = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return True
+
+@api_bp.before_request
+def serve_cached_swagger():
+    """Answer /swagger.json from the pre-built bodies before Flask-RESTx runs"""
+    if request.endpoint != f'{api_bp.name}.specs' or not _swagger_cache:
+        return None
+    
+    etag = _swagger_cache['etag']
+    if etag in request.if_none_match:
+        return Response(status=304, headers={'ETag': f'"{etag}"'})
+    
+    headers = {
+        'Cache-Control': 'public, max-age=86400',
+        'ETag': f'"{etag}"',
+        'Vary': 'Accept-Encoding'
+    }
+    # Prefer br > gzip > identity
+    for encoding in ('br', 'gzip'):
+        if encoding in _swagger_cache and encoding in request.accept_encodings:
+            headers['Content-Encoding'] = encoding
+            return Response(_swagger_cache[encoding], mimetype='application/json', headers=headers)
+    
+    return Response(_swagger_cache['raw'], mimetype='application/json', headers=headers)
+
+class OrjsonRequestProvider(DefaultJSONProvider):
+    """Flask's default JSON provider with request bodies parsed by orjson
+    
+    Decode errors are ValueErrors, so get_json() still answers them with 400.
+    """
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+@api_bp.after_request
+def compress_docs_response(response):
+    """Brotli/gzip-compress JSON and HTML responses from the docs blueprint"""
+    return compress_response(response, request.accept_encodings)
 
 def init_api_docs(app):
     """Initialize API documentation with the Flask app"""
+    api = _build_api()
+    # Keep Flask-RESTx's own encoder compact too (it indents in debug mode)
+    app.config.setdefault('RESTX_JSON', dict(COMPACT_JSON, indent=None))
+    # Parse request bodies with orjson unless the app already has its own provider
+    if ORJSON_AVAILABLE and type(app.json) is DefaultJSONProvider:
+        app.json = OrjsonRequestProvider(app)
     app.register_blueprint(api_bp, url_prefix='/api/v2')
+    
+    # Serve the read-only stubs without the Resource dispatch machinery
+    for namespace in api.namespaces:
+        for resource, *_ in namespace.resources:
+            if getattr(resource, 'plain_get_view', False):
+                endpoint = f'{api_bp.name}.{resource.endpoint}'
+                app.view_functions[endpoint] = _make_plain_view(resource, api)
+    
+    # Warm the per-model schema cache before the first request
+    for model in api.models.values():
+        model.__schema__
+    
+    # serve_cached_swagger() takes over /swagger.json once the cache is filled
+    _build_swagger_cache(app)
+    
+    # Build werkzeug's rule matcher now instead of on the first request
+    app.url_map.update()
+    
     return api
\ No newline at end of file
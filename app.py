@@ -5,13 +5,35 @@ Advanced web application with comprehensive validation, enhanced calculations, a
 """
 
 import os
+import time
+import hashlib
+import itertools
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
-from datetime import datetime
-from flask import Flask, render_template, request, jsonify
+from datetime import datetime, timezone
+from functools import wraps
+from flask import Flask, Response, render_template, request, jsonify, stream_template
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+# Optional Flask-Compress, utils.compression is used without it
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+# Optional orjson for faster JSON responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import our enhanced modules with fallbacks for Termux
 try:
     from config import get_config
@@ -46,9 +68,90 @@ except ImportError:
     def handle_validation_errors(f): return f
 
 try:
-    from utils.calculator import EnhancedROICalculator
+    from utils.calculator import EnhancedROICalculator, warm_up_kernels, NUMPY_AVAILABLE
 except ImportError:
     logging.warning("Using basic calculator - enhanced features disabled")
+    NUMPY_AVAILABLE = False
+    def warm_up_kernels(): pass
+    
+    # Real revenue multipliers based on business data (2024)
+    _REVENUE_MULT = {
+        'ecommerce_platform': 4.5,      # E-commerce 4-5x revenue multiplier
+        'mobile_app': 3.8,              # Apps 3-4x revenue multiplier  
+        'ai_integration': 6.2,          # AI projects 5-7x revenue multiplier
+        'marketing_campaign': 8.5,      # Marketing 8-12x revenue multiplier
+        'product_development': 5.2,     # Products 4-6x revenue multiplier
+        'tech_upgrade': 3.2,            # Tech upgrades 3-4x revenue multiplier
+        'automation_system': 7.8,       # Automation 6-10x revenue multiplier
+        'cybersecurity_upgrade': 2.8,   # Security 2-3x revenue multiplier
+        'digital_transformation': 4.8,  # Digital transformation 4-5x revenue multiplier
+        'cloud_migration': 3.5         # Cloud migration 3-4x revenue multiplier
+    }
+    
+    # Real cost overrun multipliers (2024 industry data)
+    _COST_OVERRUN = {
+        'ecommerce_platform': 1.12,     # 12% overrun (Magento/Shopify data)
+        'mobile_app': 1.18,             # 18% overrun (App development survey)
+        'ai_integration': 1.35,         # 35% overrun (AI complexity study)
+        'marketing_campaign': 1.08,     # 8% overrun (Predictable)
+        'product_development': 1.22,    # 22% overrun (R&D benchmarks)
+        'tech_upgrade': 1.15,           # 15% overrun (IT modernization)
+        'automation_system': 1.20,      # 20% overrun (Process automation)
+        'cybersecurity_upgrade': 1.10,  # 10% overrun (Well-defined)
+        'digital_transformation': 1.45, # 45% overrun (McKinsey study)
+        'cloud_migration': 1.25        # 25% overrun (AWS/Azure data)
+    }
+    
+    # Operating costs as a percentage of gross profit
+    _OPERATING_RATE = {
+        'ecommerce_platform': 0.08,     # 8% (Stripe + operations)
+        'mobile_app': 0.12,             # 12% (App store fees)
+        'ai_integration': 0.15,         # 15% (Compute costs)
+        'marketing_campaign': 0.05,     # 5% (Low ongoing)
+        'product_development': 0.10,    # 10% (Support, updates)
+        'tech_upgrade': 0.06,           # 6% (Maintenance)
+        'automation_system': 0.07,      # 7% (Monitoring)
+        'cybersecurity_upgrade': 0.04,  # 4% (Low ongoing)
+        'digital_transformation': 0.08, # 8% (Change management)
+        'cloud_migration': 0.09        # 9% (AWS/Azure costs)
+    }
+    
+    # Realistic business tax rates
+    _TAX_RATE = {'startup': 0.15, 'small': 0.20, 'medium': 0.25, 'large': 0.28, 'enterprise': 0.30}
+    
+    def _roi_core(investment, timeline, revenue_multiplier, cost_overrun, operating_rate, tax_rate):
+        """Scalar ROI arithmetic of the basic calculator, on plain floats
+        
+        Returns (roi_percentage, net_profit, total_revenue, payback_months).
+        """
+        # Step 1: Calculate actual project cost with overruns
+        actual_cost = investment * cost_overrun
+        
+        # Step 2: Calculate realistic revenue (business projects generate 3-10x revenue)
+        total_revenue = investment * revenue_multiplier
+        
+        # Step 3: Calculate gross profit
+        gross_profit = total_revenue - actual_cost
+        
+        # Step 4: Calculate operating costs (percentage of gross profit)
+        operating_costs = max(0, gross_profit) * operating_rate * (timeline / 12)
+        
+        # Step 5: Calculate taxes
+        taxable_profit = max(0, gross_profit - operating_costs)
+        taxes = taxable_profit * tax_rate
+        
+        # Step 6: Calculate final net profit
+        net_profit = max(-actual_cost, gross_profit - operating_costs - taxes)
+        
+        # Step 7: Calculate actual ROI percentage
+        roi_percentage = (net_profit / investment) * 100 if investment > 0 else 0
+        
+        # Step 8: Calculate payback period
+        monthly_cash_flow = net_profit / timeline if timeline > 0 else 0
+        payback_months = investment / monthly_cash_flow if monthly_cash_flow > 0 else timeline * 2
+        
+        return roi_percentage, net_profit, total_revenue, payback_months
+    
     class EnhancedROICalculator:
         def calculate_roi(self, **kwargs):
             # Realistic business ROI calculation 
@@ -57,79 +160,15 @@ except ImportError:
             project_type = kwargs.get('project_type', 'ecommerce_platform')
             company_size = kwargs.get('company_size', 'startup')
             
-            # Real revenue multipliers based on business data (2024)
-            revenue_multipliers = {
-                'ecommerce_platform': 4.5,      # E-commerce 4-5x revenue multiplier
-                'mobile_app': 3.8,              # Apps 3-4x revenue multiplier  
-                'ai_integration': 6.2,          # AI projects 5-7x revenue multiplier
-                'marketing_campaign': 8.5,      # Marketing 8-12x revenue multiplier
-                'product_development': 5.2,     # Products 4-6x revenue multiplier
-                'tech_upgrade': 3.2,            # Tech upgrades 3-4x revenue multiplier
-                'automation_system': 7.8,       # Automation 6-10x revenue multiplier
-                'cybersecurity_upgrade': 2.8,   # Security 2-3x revenue multiplier
-                'digital_transformation': 4.8,  # Digital transformation 4-5x revenue multiplier
-                'cloud_migration': 3.5         # Cloud migration 3-4x revenue multiplier
-            }
-            
-            # Real cost overrun multipliers (2024 industry data)
-            cost_overruns = {
-                'ecommerce_platform': 1.12,     # 12% overrun (Magento/Shopify data)
-                'mobile_app': 1.18,             # 18% overrun (App development survey)
-                'ai_integration': 1.35,         # 35% overrun (AI complexity study)
-                'marketing_campaign': 1.08,     # 8% overrun (Predictable)
-                'product_development': 1.22,    # 22% overrun (R&D benchmarks)
-                'tech_upgrade': 1.15,           # 15% overrun (IT modernization)
-                'automation_system': 1.20,      # 20% overrun (Process automation)
-                'cybersecurity_upgrade': 1.10,  # 10% overrun (Well-defined)
-                'digital_transformation': 1.45, # 45% overrun (McKinsey study)
-                'cloud_migration': 1.25        # 25% overrun (AWS/Azure data)
-            }
-            
             # Calculate realistic financials
-            revenue_multiplier = revenue_multipliers.get(project_type, 4.0)
-            cost_overrun = cost_overruns.get(project_type, 1.15)
-            
-            # Step 1: Calculate actual project cost with overruns
-            actual_cost = investment * cost_overrun
-            
-            # Step 2: Calculate realistic revenue (business projects generate 3-10x revenue)
-            total_revenue = investment * revenue_multiplier
+            revenue_multiplier = _REVENUE_MULT.get(project_type, 4.0)
+            cost_overrun = _COST_OVERRUN.get(project_type, 1.15)
+            operating_rate = _OPERATING_RATE.get(project_type, 0.08)
+            tax_rate = _TAX_RATE.get(company_size, 0.25)
             
-            # Step 3: Calculate gross profit
-            gross_profit = total_revenue - actual_cost
-            
-            # Step 4: Calculate operating costs (percentage of gross profit)
-            operating_rates = {
-                'ecommerce_platform': 0.08,     # 8% (Stripe + operations)
-                'mobile_app': 0.12,             # 12% (App store fees)
-                'ai_integration': 0.15,         # 15% (Compute costs)
-                'marketing_campaign': 0.05,     # 5% (Low ongoing)
-                'product_development': 0.10,    # 10% (Support, updates)
-                'tech_upgrade': 0.06,           # 6% (Maintenance)
-                'automation_system': 0.07,      # 7% (Monitoring)
-                'cybersecurity_upgrade': 0.04,  # 4% (Low ongoing)
-                'digital_transformation': 0.08, # 8% (Change management)
-                'cloud_migration': 0.09        # 9% (AWS/Azure costs)
-            }
-            
-            operating_rate = operating_rates.get(project_type, 0.08)
-            operating_costs = max(0, gross_profit) * operating_rate * (timeline / 12)
-            
-            # Step 5: Calculate taxes (realistic business tax rates)
-            tax_rates = {'startup': 0.15, 'small': 0.20, 'medium': 0.25, 'large': 0.28, 'enterprise': 0.30}
-            tax_rate = tax_rates.get(company_size, 0.25)
-            taxable_profit = max(0, gross_profit - operating_costs)
-            taxes = taxable_profit * tax_rate
-            
-            # Step 6: Calculate final net profit
-            net_profit = max(-actual_cost, gross_profit - operating_costs - taxes)
-            
-            # Step 7: Calculate actual ROI percentage
-            roi_percentage = (net_profit / investment) * 100 if investment > 0 else 0
-            
-            # Step 8: Calculate payback period
-            monthly_cash_flow = net_profit / timeline if timeline > 0 else 0
-            payback_months = investment / monthly_cash_flow if monthly_cash_flow > 0 else timeline * 2
+            roi_percentage, net_profit, total_revenue, payback_months = _roi_core(
+                investment, timeline, revenue_multiplier, cost_overrun, operating_rate, tax_rate
+            )
             
             return {
                 'roi_projection': {
@@ -146,14 +185,53 @@ except ImportError:
             }
 
 try:
-    from utils.cache import calculation_cache
+    from utils.cache import calculation_cache, SimpleCache
+    response_cache = SimpleCache(default_ttl=3600, max_entries=1024)
+    validation_cache = SimpleCache(default_ttl=60, max_entries=1024)
+    # Keys include client-chosen amounts and timelines, so keep the scenario cache bounded
+    scenario_cache = SimpleCache(default_ttl=300, max_entries=256)
 except ImportError:
     logging.warning("Using basic cache - Redis caching disabled")
     class BasicCache:
-        def get(self, key): return None
-        def set(self, key, value, timeout=None): pass
-        def stats(self): return {'hits': 0, 'misses': 0}
+        """In-process LRU cache with per-entry TTL"""
+        def __init__(self, maxsize=1024, default_ttl=300):
+            self._entries = OrderedDict()
+            self._lock = threading.Lock()
+            self.maxsize = maxsize
+            self.default_ttl = default_ttl
+            self.hits = self.misses = 0
+        
+        def get(self, key):
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry[0] <= time.monotonic():
+                    self.misses += 1
+                    return None
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        
+        def set(self, key, value, ttl=None):
+            with self._lock:
+                self._entries[key] = (time.monotonic() + (ttl or self.default_ttl), value)
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        
+        def get_or_set(self, data, calculator_func, ttl=None):
+            key = data if isinstance(data, tuple) else repr(sorted(data.items()))
+            value = self.get(key)
+            if value is None:
+                value = calculator_func()
+                self.set(key, value, ttl)
+            return value
+        
+        def stats(self):
+            return {'hits': self.hits, 'misses': self.misses, 'total_entries': len(self._entries)}
     calculation_cache = BasicCache()
+    response_cache = BasicCache()
+    validation_cache = BasicCache()
+    scenario_cache = BasicCache(maxsize=256)
 
 try:
     from utils.rate_limiter import rate_limit, calculation_limiter, api_limiter
@@ -163,6 +241,13 @@ except ImportError:
     calculation_limiter = rate_limit
     api_limiter = rate_limit
 
+try:
+    from utils.compression import compress_response, compress_stream, negotiate_encoding
+except ImportError:
+    logging.warning("Response compression disabled")
+    compress_response = None
+    def negotiate_encoding(accept_encodings): return None
+
 try:
     from utils.export import ReportGenerator
 except ImportError:
@@ -178,6 +263,13 @@ load_dotenv()
 # Get configuration based on environment
 config_class = get_config()
 
+# Config tables bound once at startup (BasicConfig has none of them)
+_CURRENCIES = getattr(config_class, 'CURRENCIES', {})
+_INDUSTRIES = getattr(config_class, 'INDUSTRIES', {})
+_PROJECTS = getattr(config_class, 'PROJECT_TYPES', None)
+_SIZES = getattr(config_class, 'COMPANY_SIZES', {})
+_CURRENCY_SYMBOLS = {code: currency.symbol for code, currency in _CURRENCIES.items()}
+
 # Check for Termux environment and adjust accordingly
 TERMUX_MODE = os.environ.get('PREFIX') is not None
 if TERMUX_MODE:
@@ -190,18 +282,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class DecimalJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes Decimal as a number and datetimes as ISO 8601
+    
+    Lets endpoints return calculator results (Decimal fields) without casting
+    every value to float first.
+    """
+    @staticmethod
+    def default(o):
+        if isinstance(o, Decimal):
+            return float(o)
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+    
+    def dumps_bytes(self, obj):
+        """Serialize obj to UTF-8 encoded JSON bytes"""
+        return self.dumps(obj).encode('utf-8')
+
+class OrjsonProvider(DecimalJSONProvider):
+    """DecimalJSONProvider backed by orjson
+    
+    orjson handles datetimes, dataclasses and NumPy values natively and only
+    calls default() for the rest (Decimal among them).
+    """
+    OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+    
+    def dumps_bytes(self, obj):
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS)
+    
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
 # Initialize Flask app
 app = Flask(__name__)
 app.config.from_object(config_class)
+app.json = OrjsonProvider(app) if ORJSON_AVAILABLE else DecimalJSONProvider(app)
+app.json.compact = True
 
 # Enable CORS if configured
 if config_class.ENABLE_CORS:
     CORS(app)
 
-# Initialize core v2.0 calculator and tools
-calculator = EnhancedROICalculator()
+# Compress large JSON/HTML responses (/api/calculate, /api/export-html)
+app.config.setdefault('COMPRESS_ALGORITHM', ['br', 'gzip'])
+app.config.setdefault('COMPRESS_MIMETYPES', ['text/html', 'text/css', 'text/csv',
+                                             'application/json', 'application/msgpack'])
+app.config.setdefault('COMPRESS_MIN_SIZE', 1024)
+app.config.setdefault('COMPRESS_LEVEL', 4)
+if COMPRESS_AVAILABLE:
+    Compress(app)
+elif compress_response is not None:
+    @app.after_request
+    def compress_app_response(response):
+        return compress_response(response, request.accept_encodings,
+                                 min_size=app.config['COMPRESS_MIN_SIZE'],
+                                 gzip_level=app.config['COMPRESS_LEVEL'])
+
+# Initialize core v2.0 tools
 report_generator = ReportGenerator()
 
+@app.template_filter('money')
+def format_money(value):
+    """Whole currency amount with thousands separators, e.g. 125,000"""
+    return f"{value:,.0f}"
+
+# Compile the HTML report template now instead of on the first export; it is
+# kept in app.jinja_env.cache and only re-checked on disk in debug mode
+app.jinja_env.get_template('roi_report.html')
+
 # Validate configuration on startup
 try:
     # Basic configuration validation
@@ -218,37 +374,242 @@ except Exception as e:
     logger.warning("Continuing with default configuration...")
     # Don't raise in Termux - just warn and continue
 
+# Process pool for CPU-bound calculations, created on first use in each worker
+_calculation_pool = None
+_calculation_pool_lock = threading.Lock()
+
+def get_calculation_pool():
+    """Return the calculation process pool, or None when calculations run inline"""
+    global _calculation_pool
+    workers = getattr(config_class, 'CALCULATION_WORKERS', 0)
+    if _calculation_pool is None and workers > 0 and not TERMUX_MODE:
+        # Concurrent first requests must not each start a pool
+        with _calculation_pool_lock:
+            if _calculation_pool is None:
+                _calculation_pool = ProcessPoolExecutor(max_workers=workers)
+    return _calculation_pool
+
+# Core v2.0 calculator, created on first use in each worker
+_calculator = None
+
+def get_calculator():
+    """Return the shared ROI calculator, creating and warming it up on first use
+    
+    Deferred so importing the app (flask routes, the reloader's parent
+    process) does not build the calculator or compile its kernels.
+    """
+    global _calculator
+    if _calculator is None:
+        _calculator = EnhancedROICalculator()
+        warm_up_kernels()
+    return _calculator
+
+def run_roi_calculation(params):
+    """Project cost and enhanced ROI projection for validated /api/calculate input
+    
+    Module-level so it can be pickled and run in the calculation pool.
+    """
+    return get_calculator().calculate_full(params)
+
+def run_scenario_analysis(params):
+    """Scenario analysis for /api/scenario-analysis, keyword arguments in a dict
+    
+    Module-level so it can be pickled and run in the calculation pool.
+    """
+    return get_calculator().calculate_scenario_analysis(**params)
+
+def run_calculation(func, *args):
+    """Run func in the calculation pool, or inline when the pool is disabled"""
+    pool = get_calculation_pool()
+    if pool is None:
+        return func(*args)
+    return pool.submit(func, *args).result(timeout=config_class.CALCULATION_TIMEOUT)
+
+# Per-process sequence keeping calculation ids unique within the same nanosecond
+_calc_counter = itertools.count()
+
+def next_calculation_id(prefix='calc'):
+    """Unique calculation id: hex wall-clock nanoseconds plus a sequence number"""
+    return f"{prefix}_{time.time_ns():x}_{next(_calc_counter):x}"
+
+def merge_encoded_objects(*bodies):
+    """Join compact JSON objects encoded by app.json into one object body
+    
+    Each body must be a non-empty object; their keys must not overlap.
+    """
+    return b'{' + b','.join(body[1:-1] for body in bodies) + b'}'
+
+# Endpoints whose body is decoded by load_json_body()
+_JSON_BODY_ENDPOINTS = frozenset(['calculate_roi', 'validate_input'])
+
+@app.before_request
+def require_json_body():
+    """Reject non-JSON POST bodies for JSON endpoints before rate limiting and validation
+    
+    CORS preflight (OPTIONS) requests carry no body and pass through.
+    """
+    if request.method == 'POST' and request.endpoint in _JSON_BODY_ENDPOINTS and not request.is_json:
+        error = ValidationError("Content-Type must be application/json", code="UNSUPPORTED_MEDIA_TYPE")
+        return jsonify({'error': True, 'validation_error': error.to_dict()}), 400
+
+def load_json_body():
+    """Decode the request body with the app's JSON provider (orjson when available)
+    
+    Reads the raw bytes directly instead of going through request.get_json(),
+    and reports malformed bodies as a validation error rather than a BadRequest.
+    The Content-Type was already checked by require_json_body().
+    """
+    try:
+        return app.json.loads(request.get_data())
+    except ValueError:
+        raise ValidationError("Invalid JSON", code="BAD_JSON")
+
+def validate_calculation_request(data):
+    """Validate a calculation payload, reusing the result for a repeated body
+    
+    Clients commonly POST the same body to /api/validate and then to
+    /api/calculate, so successful results are kept briefly under a hash of
+    the raw request body. Failures are not cached.
+    """
+    key = hashlib.blake2b(request.get_data(), digest_size=16).hexdigest()
+    validated_data = validation_cache.get(key)
+    if validated_data is None:
+        validated_data = APIValidator.validate_roi_calculation_request(data)
+        BusinessValidator.validate_business_logic(
+            validated_data['company_size'],
+            validated_data['project_type'],
+            validated_data['target_industry'],
+            validated_data.get('custom_investment')
+        )
+        validation_cache.set(key, validated_data, ttl=60)
+    # Callers adjust their copy (e.g. sanitized company_name)
+    return dict(validated_data)
+
+def calculate_cached(validated_data):
+    """Cost analysis and ROI projection for validated input, shared by /api/calculate and the HTML report
+    
+    Results are kept in calculation_cache for 5 minutes, keyed by the inputs
+    the calculation depends on.
+    """
+    custom_investment = validated_data.get('custom_investment')
+    cache_key = (
+        validated_data['company_size'],
+        validated_data['project_type'],
+        validated_data['target_industry'],
+        validated_data['currency'],
+        float(custom_investment) if custom_investment else None,
+        validated_data.get('custom_timeline')
+    )
+    return calculation_cache.get_or_set(
+        cache_key, lambda: run_calculation(run_roi_calculation, validated_data), ttl=300
+    )
+
+# Reports for the same inputs differ only in generation time and Monte Carlo
+# sampling, so they share a weak ETag; the salt retires tags on restart/deploy
+_REPORT_ETAG_SALT = f'{time.time_ns():x}:'.encode()
+REPORT_CACHE_CONTROL = 'private, max-age=60'
+
+# Cost breakdown rows of the HTML report, in display order
+REPORT_COST_ROWS = (
+    ('development', 'Development'),
+    ('infrastructure', 'Infrastructure'),
+    ('maintenance_annual', 'Annual Maintenance'),
+    ('regulatory_compliance', 'Regulatory Compliance'),
+    ('risk_buffer', 'Risk Buffer')
+)
+
+# Encoded bodies of endpoints built only from the startup configuration
+_static_responses = {}
+_static_views = []
+STATIC_CACHE_CONTROL = 'public, max-age=3600'
+
+def static_json_response(f):
+    """Encode a config-only endpoint's response once and reuse the bytes
+    
+    The first successful response is stored with an ETag; later requests are
+    answered from it, or with 304 when If-None-Match matches, and browsers
+    may reuse it for an hour. Error responses
+    are never stored. The handler body, including its string formatting of
+    config values, thus runs once per process.
+    """
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        cached = _static_responses.get(f.__name__)
+        if cached is None:
+            response = f(*args, **kwargs)
+            if response.status_code != 200:
+                return response
+            body = response.get_data()
+            etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+            headers = {'ETag': f'"{etag}"', 'Cache-Control': STATIC_CACHE_CONTROL}
+            cached = _static_responses[f.__name__] = (body, etag, headers)
+        
+        body, etag, headers = cached
+        if request.if_none_match.contains_weak(etag):
+            return Response(status=304, headers=headers)
+        return Response(body, mimetype='application/json', headers=headers)
+    _static_views.append(wrapper)
+    return wrapper
+
+def prime_static_responses():
+    """Build every config-only response before the first request arrives
+    
+    Bypasses rate limiting; a view that fails is logged and left to build
+    (or fail) on its first real request.
+    """
+    with app.test_request_context():
+        for view in _static_views:
+            try:
+                view()
+            except Exception:
+                logger.warning("Could not prime %s", view.__name__, exc_info=True)
+
 @app.route('/')
 def index():
     """Main application page"""
     return render_template('index.html')
 
 
+# Encoded healthy response and the monotonic time it is served until
+_health_body = (0.0, b'')
+HEALTH_REFRESH_SECONDS = 1.0
+
 @app.route('/api/health')
 def health_check():
-    """Health check endpoint with system status"""
-    try:
-        cache_stats = calculation_cache.stats()
-        
-        return jsonify({
-            'status': 'healthy',
-            'version': '2.0.1',
-            'timestamp': datetime.utcnow().isoformat(),
-            'features': {
-                'caching': True,
-                'rate_limiting': True,
-                'numpy_available': 'NUMPY_AVAILABLE' in globals() and globals().get('NUMPY_AVAILABLE', False),
-                'enhanced_validation': True
-            },
-            'cache_stats': cache_stats,
-            'environment': config_class.ENV
-        })
-    except Exception as e:
-        return jsonify({
-            'status': 'degraded',
-            'error': str(e),
-            'timestamp': datetime.utcnow().isoformat()
-        }), 503
+    """Health check endpoint with system status
+    
+    The healthy body is re-encoded at most once per HEALTH_REFRESH_SECONDS,
+    so frequent load balancer polls do not each recompute the cache stats.
+    """
+    global _health_body
+    expires, body = _health_body
+    now = time.monotonic()
+    if now >= expires:
+        try:
+            cache_stats = calculation_cache.stats()
+            
+            body = app.json.dumps_bytes({
+                'status': 'healthy',
+                'version': '2.0.1',
+                'timestamp': datetime.utcnow().isoformat(),
+                'features': {
+                    'caching': True,
+                    'rate_limiting': True,
+                    'numpy_available': NUMPY_AVAILABLE,
+                    'enhanced_validation': True
+                },
+                'cache_stats': cache_stats,
+                'environment': config_class.ENV
+            })
+        except Exception as e:
+            return jsonify({
+                'status': 'degraded',
+                'error': str(e),
+                'timestamp': datetime.utcnow().isoformat()
+            }), 503
+        _health_body = (now + HEALTH_REFRESH_SECONDS, body)
+    
+    return Response(body, mimetype=app.json.mimetype)
 
 @app.route('/api/calculate', methods=['POST'])
 @rate_limit(calculation_limiter, "Too many calculations. Please wait before trying again.")
@@ -269,71 +630,31 @@ def calculate_roi():
         "custom_timeline": 12         // optional
     }
     """
-    try:
-        # Get and validate request data
-        data = request.get_json()
-        if not data:
-            raise ValidationError("No JSON data provided", code="NO_DATA")
-        
-        # Comprehensive validation
-        validated_data = APIValidator.validate_roi_calculation_request(data)
-        
-        # Enhanced sanitization
-        validated_data['company_name'] = DataSanitizer.sanitize_company_name(validated_data['company_name'])
-        
-        # Business logic validation
-        custom_investment = validated_data.get('custom_investment')
-        BusinessValidator.validate_business_logic(
-            validated_data['company_size'],
-            validated_data['project_type'], 
-            validated_data['target_industry'],
-            custom_investment
-        )
-        
-        # Use caching for expensive calculations
-        cache_key_data = {
-            'company_size': validated_data['company_size'],
-            'project_type': validated_data['project_type'],
-            'industry': validated_data['target_industry'],
-            'currency': validated_data['currency'],
-            'custom_investment': float(custom_investment) if custom_investment else None,
-            'custom_timeline': validated_data.get('custom_timeline')
-        }
-        
-        def perform_calculations():
-            # Calculate project cost
-            cost_analysis = calculator.calculate_project_cost(
-                company_size=validated_data['company_size'],
-                project_type=validated_data['project_type'],
-                industry=validated_data['target_industry'],
-                currency=validated_data['currency'],
-                custom_investment=custom_investment,
-                custom_timeline=validated_data.get('custom_timeline')
-            )
-            
-            # Calculate enhanced ROI projection
-            roi_result = calculator.calculate_enhanced_roi_projection(
-                investment=cost_analysis['total_cost'],
-                industry=validated_data['target_industry'],
-                project_type=validated_data['project_type'],
-                timeline_months=cost_analysis['timeline_months'],
-                currency=validated_data['currency'],
-                company_size=validated_data['company_size'],
-                target_roi=validated_data.get('target_roi')
-            )
-            
-            return cost_analysis, roi_result
-        
-        # Get cached result or calculate
-        cost_analysis, roi_result = calculation_cache.get_or_set(
-            cache_key_data, perform_calculations, ttl=300  # Cache for 5 minutes
-        )
+    # Get and validate request data
+    data = load_json_body()
+    if not data:
+        raise ValidationError("No JSON data provided", code="NO_DATA")
+    
+    # Comprehensive and business logic validation
+    validated_data = validate_calculation_request(data)
+    custom_investment = validated_data.get('custom_investment')
+    
+    # Enhanced sanitization
+    validated_data['company_name'] = DataSanitizer.sanitize_company_name(validated_data['company_name'])
+    
+    def build_response():
+        """Run the calculation and encode the response fields derived from it
         
-        # Get market insights
+        Returns the encoded body with the ROI and risk score for the log line.
+        """
+        cost_analysis, roi_result = calculate_cached(validated_data)
+    
+        # Get market insights (memoized per industry; recommendations need roi_result)
+        calculator = get_calculator()
         market_insights = calculator.get_market_insights(validated_data['target_industry'])
-        
+    
         # Core v2.0 - basic recommendations only
-        
+    
         # Generate recommendations
         recommendations = calculator.generate_recommendations(
             validated_data['company_size'],
@@ -342,620 +663,343 @@ def calculate_roi():
             roi_result,
             validated_data.get('target_roi')
         )
-        
+    
         # Core v2.0 - focus on enhanced calculations and basic business intelligence
-        
+    
         # Format response
-        currency_config = config_class.CURRENCIES[validated_data['currency']]
-        
         response = {
-            'success': True,
-            'calculation_id': f"calc_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
-            'input_parameters': validated_data,
             'cost_analysis': {
-                'total_cost': float(cost_analysis['total_cost']),
-                'cost_breakdown': {k: float(v) for k, v in cost_analysis['cost_breakdown'].items()},
+                'total_cost': cost_analysis['total_cost'],
+                'cost_breakdown': cost_analysis['cost_breakdown'],
                 'timeline_months': cost_analysis['timeline_months'],
                 'currency': cost_analysis['currency'],
-                'currency_symbol': currency_config.symbol,
+                'currency_symbol': _CURRENCY_SYMBOLS[validated_data['currency']],
                 'multipliers': cost_analysis['multipliers']
             },
+            # Decimal values are encoded as numbers by the app's JSON provider
             'roi_projection': {
-                'total_investment': float(roi_result.total_investment),
-                'projected_revenue': float(roi_result.projected_revenue),
-                'net_profit': float(roi_result.net_profit),
-                'roi_percentage': float(roi_result.roi_percentage),
+                'total_investment': roi_result.total_investment,
+                'projected_revenue': roi_result.projected_revenue,
+                'net_profit': roi_result.net_profit,
+                'roi_percentage': roi_result.roi_percentage,
                 'payback_period_months': roi_result.payback_period_months,
-                'break_even_point': float(roi_result.break_even_point),
-                'npv': float(roi_result.npv),
-                'irr': float(roi_result.irr),
-                'risk_score': float(roi_result.risk_score),
+                'break_even_point': roi_result.break_even_point,
+                'npv': roi_result.npv,
+                'irr': roi_result.irr,
+                'risk_score': roi_result.risk_score,
                 'confidence_interval': {
-                    'lower': float(roi_result.confidence_interval[0]),
-                    'upper': float(roi_result.confidence_interval[1])
+                    'lower': roi_result.confidence_interval[0],
+                    'upper': roi_result.confidence_interval[1]
                 },
                 'sensitivity_analysis': roi_result.sensitivity_analysis
             },
             'market_insights': market_insights,
             'recommendations': recommendations,
             'calculation_metadata': {
-                'calculation_date': roi_result.calculation_date.isoformat(),
+                'calculation_date': roi_result.calculation_date,
                 'calculator_version': '2.0.0',
                 'methodology': 'Enhanced Monte Carlo with NPV/IRR analysis'
             }
         }
-        
-        logger.info(f"ROI calculation completed for {validated_data['company_name']} - "
-                   f"ROI: {roi_result.roi_percentage}%, Risk: {roi_result.risk_score}")
-        
-        return jsonify(response)
-        
-    except ValidationError:
-        raise  # Re-raise validation errors to be handled by decorator
-    except BusinessLogicError:
-        raise  # Re-raise business logic errors to be handled by decorator
-    except Exception as e:
-        logger.error(f"Unexpected error in calculate_roi: {str(e)}")
-        raise ValidationError(f"Calculation failed: {str(e)}")
+    
+        return app.json.dumps_bytes(response), roi_result.roi_percentage, roi_result.risk_score
+    
+    # Encoded results are cached in a bounded LRU, keyed without company_name
+    # since it does not change the numbers; standard inputs stay for an hour,
+    # custom investment/timeline ones as long as the calculation
+    cache_key = tuple(item for item in validated_data.items() if item[0] != 'company_name')
+    standard = custom_investment is None and validated_data.get('custom_timeline') is None
+    body, roi_percentage, risk_score = response_cache.get_or_set(cache_key, build_response,
+                                                                 ttl=3600 if standard else 300)
+    
+    logger.info("ROI calculation completed for %s - ROI: %s%%, Risk: %s",
+                validated_data['company_name'], roi_percentage, risk_score)
+    
+    # Only the id and the request's own inputs are encoded per request
+    head = app.json.dumps_bytes({
+        'calculation_id': next_calculation_id(),
+        'success': True,
+        'input_parameters': validated_data
+    })
+    return Response(merge_encoded_objects(head, body), mimetype=app.json.mimetype)
 
 @app.route('/api/currencies')
 @rate_limit(api_limiter, "Too many API requests. Please slow down.")
 @handle_validation_errors
+@static_json_response
 def get_currencies():
     """Get available currencies with enhanced information"""
-    try:
-        currencies = {}
-        for code, config in config_class.CURRENCIES.items():
-            currencies[code] = {
-                'symbol': config.symbol,
-                'name': config.name,
-                'rate': config.rate,
-                'precision': config.precision
-            }
-        
-        return jsonify({
-            'success': True,
-            'currencies': currencies,
-            'default_currency': config_class.DEFAULT_CURRENCY
-        })
-        
-    except Exception as e:
-        logger.error(f"Error fetching currencies: {str(e)}")
-        raise ValidationError(f"Failed to fetch currencies: {str(e)}")
+    currencies = {}
+    for code, config in _CURRENCIES.items():
+        currencies[code] = {
+            'symbol': config.symbol,
+            'name': config.name,
+            'rate': config.rate,
+            'precision': config.precision
+        }
+    
+    return jsonify({
+        'success': True,
+        'currencies': currencies,
+        'default_currency': config_class.DEFAULT_CURRENCY
+    })
 
 @app.route('/api/industries')
 @rate_limit(api_limiter, "Too many API requests. Please slow down.")
 @handle_validation_errors
+@static_json_response
 def get_industries():
     """Get available industries with enhanced information"""
-    try:
-        industries = []
-        for key, config in config_class.INDUSTRIES.items():
-            industries.append({
-                'id': key,
-                'name': key.replace('_', ' ').title(),
-                'growth_rate': f"{config.growth_rate * 100:.1f}%",
-                'market_size': config.market_size,
-                'risk_level': calculator._get_risk_level_description(config.risk_factor),
-                'volatility': f"{config.volatility * 100:.1f}%",
-                'regulatory_complexity': config.regulatory_complexity
-            })
-        
-        return jsonify({
-            'success': True,
-            'industries': industries
+    calculator = get_calculator()
+    industries = []
+    for key, config in _INDUSTRIES.items():
+        industries.append({
+            'id': key,
+            'name': key.replace('_', ' ').title(),
+            'growth_rate': f"{config.get('growth_rate', 0.1) * 100:.1f}%",
+            'market_size': config.get('market_size'),
+            'risk_level': calculator._get_risk_level_description(config.get('risk_factor', 0.1)),
+            'volatility': f"{config.get('volatility', 0.1) * 100:.1f}%",
+            'regulatory_complexity': config.get('regulatory_complexity', 'Medium')
         })
-        
-    except Exception as e:
-        logger.error(f"Error fetching industries: {str(e)}")
-        raise ValidationError(f"Failed to fetch industries: {str(e)}")
+    
+    return jsonify({
+        'success': True,
+        'industries': industries
+    })
 
 @app.route('/api/projects')
 @handle_validation_errors
+@static_json_response
 def get_projects():
     """Get available project types with enhanced information"""
-    try:
-        projects = []
-        
-        # Handle both object and dictionary config formats
-        if hasattr(config_class, 'PROJECT_TYPES'):
-            project_types = config_class.PROJECT_TYPES
-        else:
-            # Fallback project types for basic functionality
-            project_types = {
-                'product_development': {
-                    'description': 'New Product Development',
-                    'complexity': 'High',
-                    'timeline': 12,
-                    'base_cost': 150000,
-                    'roi_potential': 2.5,
-                    'risk_level': 0.3,
-                    'required_skills': ['Product Manager', 'Software Engineer', 'Designer']
-                },
-                'mobile_app': {
-                    'description': 'Mobile Application',
-                    'complexity': 'High',
-                    'timeline': 8,
-                    'base_cost': 90000,
-                    'roi_potential': 2.4,
-                    'risk_level': 0.32,
-                    'required_skills': ['Mobile Developer', 'UI/UX Designer']
-                },
-                'ecommerce_platform': {
-                    'description': 'E-commerce Platform',
-                    'complexity': 'High',
-                    'timeline': 10,
-                    'base_cost': 120000,
-                    'roi_potential': 2.8,
-                    'risk_level': 0.28,
-                    'required_skills': ['E-commerce Developer', 'UX Designer']
-                },
-                'marketing_campaign': {
-                    'description': 'Marketing Campaign',
-                    'complexity': 'Low',
-                    'timeline': 4,
-                    'base_cost': 50000,
-                    'roi_potential': 1.5,
-                    'risk_level': 0.25,
-                    'required_skills': ['Marketing Manager', 'Designer']
-                }
+    projects = []
+    
+    # Handle both object and dictionary config formats
+    if _PROJECTS is not None:
+        project_types = _PROJECTS
+    else:
+        # Fallback project types for basic functionality
+        project_types = {
+            'product_development': {
+                'description': 'New Product Development',
+                'complexity': 'High',
+                'timeline': 12,
+                'base_cost': 150000,
+                'roi_potential': 2.5,
+                'risk_level': 0.3,
+                'required_skills': ['Product Manager', 'Software Engineer', 'Designer']
+            },
+            'mobile_app': {
+                'description': 'Mobile Application',
+                'complexity': 'High',
+                'timeline': 8,
+                'base_cost': 90000,
+                'roi_potential': 2.4,
+                'risk_level': 0.32,
+                'required_skills': ['Mobile Developer', 'UI/UX Designer']
+            },
+            'ecommerce_platform': {
+                'description': 'E-commerce Platform',
+                'complexity': 'High',
+                'timeline': 10,
+                'base_cost': 120000,
+                'roi_potential': 2.8,
+                'risk_level': 0.28,
+                'required_skills': ['E-commerce Developer', 'UX Designer']
+            },
+            'marketing_campaign': {
+                'description': 'Marketing Campaign',
+                'complexity': 'Low',
+                'timeline': 4,
+                'base_cost': 50000,
+                'roi_potential': 1.5,
+                'risk_level': 0.25,
+                'required_skills': ['Marketing Manager', 'Designer']
             }
-        
-        for key, config in project_types.items():
-            # Handle both object attributes and dictionary keys
-            if isinstance(config, dict):
-                projects.append({
-                    'id': key,
-                    'name': config.get('description', key.replace('_', ' ').title()),
-                    'description': config.get('description', 'No description available'),
-                    'complexity': config.get('complexity', 'Medium'),
-                    'timeline': f"{config.get('timeline', 6)} months",
-                    'base_cost': f"${config.get('base_cost', 100000):,}",
-                    'roi_potential': f"{config.get('roi_potential', 2.0):.1f}x",
-                    'risk_level': f"{config.get('risk_level', 0.2) * 100:.1f}%",
-                    'required_skills': config.get('required_skills', [])
-                })
-            else:
-                # Handle object format (legacy)
-                projects.append({
-                    'id': key,
-                    'name': getattr(config, 'description', key.replace('_', ' ').title()),
-                    'description': getattr(config, 'description', 'No description available'),
-                    'complexity': getattr(config, 'complexity', 'Medium'),
-                    'timeline': f"{getattr(config, 'timeline', 6)} months",
-                    'base_cost': f"${getattr(config, 'base_cost', 100000):,}",
-                    'roi_potential': f"{getattr(config, 'roi_potential', 2.0):.1f}x",
-                    'risk_level': f"{getattr(config, 'risk_level', 0.2) * 100:.1f}%",
-                    'required_skills': getattr(config, 'required_skills', [])
-                })
-        
-        return jsonify({
-            'success': True,
-            'projects': projects
-        })
-        
-    except Exception as e:
-        logger.error(f"Error fetching projects: {str(e)}")
-        raise ValidationError(f"Failed to fetch projects: {str(e)}")
+        }
+    
+    for key, config in project_types.items():
+        # Handle both object attributes and dictionary keys
+        if isinstance(config, dict):
+            projects.append({
+                'id': key,
+                'name': config.get('description', key.replace('_', ' ').title()),
+                'description': config.get('description', 'No description available'),
+                'complexity': config.get('complexity', 'Medium'),
+                'timeline': f"{config.get('timeline', 6)} months",
+                'base_cost': f"${config.get('base_cost', 100000):,}",
+                'roi_potential': f"{config.get('roi_potential', 2.0):.1f}x",
+                'risk_level': f"{config.get('risk_level', 0.2) * 100:.1f}%",
+                'required_skills': config.get('required_skills', [])
+            })
+        else:
+            # Handle object format (legacy)
+            projects.append({
+                'id': key,
+                'name': getattr(config, 'description', key.replace('_', ' ').title()),
+                'description': getattr(config, 'description', 'No description available'),
+                'complexity': getattr(config, 'complexity', 'Medium'),
+                'timeline': f"{getattr(config, 'timeline', 6)} months",
+                'base_cost': f"${getattr(config, 'base_cost', 100000):,}",
+                'roi_potential': f"{getattr(config, 'roi_potential', 2.0):.1f}x",
+                'risk_level': f"{getattr(config, 'risk_level', 0.2) * 100:.1f}%",
+                'required_skills': getattr(config, 'required_skills', [])
+            })
+    
+    return jsonify({
+        'success': True,
+        'projects': projects
+    })
 
 @app.route('/api/company-sizes')
 @handle_validation_errors
+@static_json_response
 def get_company_sizes():
     """Get available company sizes with enhanced information"""
-    try:
-        company_sizes = []
-        for key, config in config_class.COMPANY_SIZES.items():
-            # Handle both dictionary and object formats
-            if isinstance(config, dict):
-                company_sizes.append({
-                    'id': key,
-                    'name': config.get('name', key.title()),
-                    'multiplier': config.get('cost_multiplier', 1.0),
-                    'budget_range': {
-                        'min': config.get('min_budget', 1000),
-                        'max': config.get('max_budget', 10000000)
-                    },
-                    'typical_team_size': config.get('typical_team_size', 10),
-                    'risk_factor': f"{config.get('risk_multiplier', 1.0) * 100:.1f}%",
-                    'description': config.get('description', 'No description available')
-                })
-            else:
-                # Handle object format (legacy)
-                company_sizes.append({
-                    'id': key,
-                    'name': getattr(config, 'name', key.title()),
-                    'multiplier': getattr(config, 'multiplier', 1.0),
-                    'budget_range': {
-                        'min': getattr(config, 'min_budget', 1000),
-                        'max': getattr(config, 'max_budget', 10000000)
-                    },
-                    'typical_team_size': getattr(config, 'typical_team_size', 10),
-                    'risk_factor': f"{getattr(config, 'risk_factor', 1.0) * 100:.1f}%"
-                })
-        
-        return jsonify({
-            'success': True,
-            'company_sizes': company_sizes
-        })
-        
-    except Exception as e:
-        logger.error(f"Error fetching company sizes: {str(e)}")
-        raise ValidationError(f"Failed to fetch company sizes: {str(e)}")
+    company_sizes = []
+    for key, config in _SIZES.items():
+        # Handle both dictionary and object formats
+        if isinstance(config, dict):
+            company_sizes.append({
+                'id': key,
+                'name': config.get('name', key.title()),
+                'multiplier': config.get('cost_multiplier', 1.0),
+                'budget_range': {
+                    'min': config.get('min_budget', 1000),
+                    'max': config.get('max_budget', 10000000)
+                },
+                'typical_team_size': config.get('typical_team_size', 10),
+                'risk_factor': f"{config.get('risk_multiplier', 1.0) * 100:.1f}%",
+                'description': config.get('description', 'No description available')
+            })
+        else:
+            # Handle object format (legacy)
+            company_sizes.append({
+                'id': key,
+                'name': getattr(config, 'name', key.title()),
+                'multiplier': getattr(config, 'multiplier', 1.0),
+                'budget_range': {
+                    'min': getattr(config, 'min_budget', 1000),
+                    'max': getattr(config, 'max_budget', 10000000)
+                },
+                'typical_team_size': getattr(config, 'typical_team_size', 10),
+                'risk_factor': f"{getattr(config, 'risk_factor', 1.0) * 100:.1f}%"
+            })
+    
+    return jsonify({
+        'success': True,
+        'company_sizes': company_sizes
+    })
 
 @app.route('/api/market-insights/<industry>')
 @handle_validation_errors
 def get_market_insights_api(industry):
     """Get detailed market insights for a specific industry"""
-    try:
-        # Validate industry
-        validated_industry = APIValidator.validate_industry(industry)
-        
-        # Get market insights
-        insights = calculator.get_market_insights(validated_industry)
-        
-        return jsonify({
-            'success': True,
-            'industry': validated_industry,
-            'insights': insights
-        })
-        
-    except ValidationError:
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching market insights: {str(e)}")
-        raise ValidationError(f"Failed to fetch market insights: {str(e)}")
+    # Validate industry
+    validated_industry = APIValidator.validate_industry(industry)
+    
+    # Get market insights
+    insights = get_calculator().get_market_insights(validated_industry)
+    
+    return jsonify({
+        'success': True,
+        'industry': validated_industry,
+        'insights': insights
+    })
 
 @app.route('/api/validate', methods=['POST'])
 @handle_validation_errors
 def validate_input():
     """Validate user input without performing calculations"""
-    try:
-        data = request.get_json()
-        if not data:
-            raise ValidationError("No JSON data provided", code="NO_DATA")
-        
-        # Validate the request
-        validated_data = APIValidator.validate_roi_calculation_request(data)
-        
-        # Perform business logic validation
-        custom_investment = validated_data.get('custom_investment')
-        BusinessValidator.validate_business_logic(
-            validated_data['company_size'],
-            validated_data['project_type'],
-            validated_data['target_industry'],
-            custom_investment
-        )
-        
-        return jsonify({
-            'success': True,
-            'message': 'Input validation successful',
-            'validated_data': {
-                k: str(v) if isinstance(v, Decimal) else v 
-                for k, v in validated_data.items()
-            }
-        })
-        
-    except ValidationError:
-        raise
-    except BusinessLogicError:
-        raise
-    except Exception as e:
-        logger.error(f"Error in input validation: {str(e)}")
-        raise ValidationError(f"Validation failed: {str(e)}")
+    data = load_json_body()
+    if not data:
+        raise ValidationError("No JSON data provided", code="NO_DATA")
+    
+    # Validate the request, including business logic
+    validated_data = validate_calculation_request(data)
+    
+    return jsonify({
+        'success': True,
+        'message': 'Input validation successful',
+        'validated_data': {
+            k: str(v) if isinstance(v, Decimal) else v 
+            for k, v in validated_data.items()
+        }
+    })
 
 @app.route('/api/export-html')
 @handle_validation_errors 
 def export_html_report():
     """Generate comprehensive HTML report"""
-    try:
-        # Get calculation parameters from URL
-        company_name = request.args.get('company', 'Sample Company')
-        company_size = request.args.get('company_size', 'medium')
-        current_industry = request.args.get('current_industry', 'saas')
-        project_type = request.args.get('project_type', 'product_development')
-        target_industry = request.args.get('target_industry', 'saas')
-        currency = request.args.get('currency', 'USD')
-        
-        # Validate parameters
-        validated_data = {
-            'company_name': APIValidator.validate_company_name(company_name),
-            'company_size': APIValidator.validate_company_size(company_size),
-            'current_industry': APIValidator.validate_industry(current_industry),
-            'project_type': APIValidator.validate_project_type(project_type),
-            'target_industry': APIValidator.validate_industry(target_industry),
-            'currency': APIValidator.validate_currency(currency)
-        }
-        
-        # Perform calculations
-        cost_analysis = calculator.calculate_project_cost(
-            validated_data['company_size'], 
-            validated_data['project_type'], 
-            validated_data['target_industry'], 
-            validated_data['currency']
-        )
-        
-        roi_result = calculator.calculate_enhanced_roi_projection(
-            cost_analysis['total_cost'], 
-            validated_data['target_industry'], 
-            validated_data['project_type'], 
-            cost_analysis['timeline_months'],
-            validated_data['currency'],
-            validated_data['company_size']
-        )
-        
-        market_insights = calculator.get_market_insights(validated_data['target_industry'])
-        recommendations = calculator.generate_recommendations(
-            validated_data['company_size'], 
-            validated_data['project_type'], 
-            validated_data['target_industry'],
-            roi_result
-        )
-        
-        # Generate enhanced HTML report
-        currency_config = config_class.CURRENCIES[validated_data['currency']]
-        
-        html_report = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Business ROI Analysis Report - {validated_data['company_name']}</title>
-    <style>
-        body {{ 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            margin: 40px; 
-            background: #f8f9fa; 
-            line-height: 1.6;
-        }}
-        .container {{ 
-            background: white; 
-            padding: 40px; 
-            border-radius: 15px; 
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1); 
-            max-width: 1000px; 
-            margin: 0 auto; 
-        }}
-        h1 {{ 
-            color: #667eea; 
-            text-align: center; 
-            font-size: 2.5rem; 
-            margin-bottom: 2rem; 
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 1rem;
-        }}
-        h2 {{ 
-            color: #4a5568; 
-            border-bottom: 2px solid #667eea; 
-            padding-bottom: 0.5rem; 
-            margin-top: 2rem; 
-        }}
-        .header-info {{ 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-            color: white; 
-            padding: 20px; 
-            border-radius: 10px; 
-            margin-bottom: 30px; 
-        }}
-        .metric-grid {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); 
-            gap: 20px; 
-            margin: 20px 0; 
-        }}
-        .metric {{ 
-            background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); 
-            color: white; 
-            padding: 20px; 
-            border-radius: 10px; 
-            text-align: center; 
-            box-shadow: 0 4px 15px rgba(79, 172, 254, 0.3);
-        }}
-        .metric-value {{ 
-            font-size: 2rem; 
-            font-weight: bold; 
-            margin-bottom: 0.5rem; 
-        }}
-        .metric-label {{ 
-            font-size: 0.9rem; 
-            opacity: 0.9; 
-        }}
-        .risk-indicator {{
-            padding: 5px 15px;
-            border-radius: 20px;
-            font-weight: bold;
-            display: inline-block;
-            margin: 5px 0;
-        }}
-        .risk-low {{ background: #48bb78; color: white; }}
-        .risk-medium {{ background: #ed8936; color: white; }}
-        .risk-high {{ background: #e53e3e; color: white; }}
-        .recommendations {{ 
-            background: #e6fffa; 
-            padding: 20px; 
-            border-radius: 10px; 
-            border-left: 4px solid #38b2ac; 
-        }}
-        .cost-breakdown {{
-            background: #f7fafc;
-            padding: 20px;
-            border-radius: 10px;
-            margin: 20px 0;
-        }}
-        .confidence-interval {{
-            background: #fff5f5;
-            padding: 15px;
-            border-radius: 8px;
-            border-left: 4px solid #e53e3e;
-            margin: 15px 0;
-        }}
-        table {{ 
-            width: 100%; 
-            border-collapse: collapse; 
-            margin: 20px 0; 
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1); 
-        }}
-        th, td {{ 
-            padding: 15px; 
-            text-align: left; 
-            border-bottom: 1px solid #e2e8f0; 
-        }}
-        th {{ 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-            color: white; 
-            font-weight: 600; 
-        }}
-        tr:nth-child(even) {{ background-color: #f7fafc; }}
-        .footer {{ 
-            text-align: center; 
-            margin-top: 40px; 
-            padding: 20px; 
-            background: #f7fafc; 
-            border-radius: 10px; 
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>📊 Business ROI Analysis Report</h1>
-        
-        <div class="header-info">
-            <h3>🏢 {validated_data['company_name']}</h3>
-            <p><strong>Company Size:</strong> {validated_data['company_size'].title()}</p>
-            <p><strong>Industry:</strong> {validated_data['target_industry'].replace('_', ' ').title()}</p>
-            <p><strong>Project Type:</strong> {config_class.PROJECT_TYPES[validated_data['project_type']].description}</p>
-            <p><strong>Currency:</strong> {currency_config.name} ({currency_config.symbol})</p>
-            <p><strong>Report Generated:</strong> {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
-        </div>
-        
-        <div class="section">
-            <h2>💰 Financial Summary</h2>
-            <div class="metric-grid">
-                <div class="metric">
-                    <div class="metric-value">{currency_config.symbol}{roi_result.total_investment:,.0f}</div>
-                    <div class="metric-label">Total Investment</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">{currency_config.symbol}{roi_result.projected_revenue:,.0f}</div>
-                    <div class="metric-label">Projected Revenue</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">{roi_result.roi_percentage:.1f}%</div>
-                    <div class="metric-label">ROI Percentage</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">{roi_result.payback_period_months}</div>
-                    <div class="metric-label">Payback (Months)</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>🎯 Advanced Financial Metrics</h2>
-            <div class="metric-grid">
-                <div class="metric">
-                    <div class="metric-value">{currency_config.symbol}{roi_result.npv:,.0f}</div>
-                    <div class="metric-label">Net Present Value</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">{roi_result.irr:.2f}%</div>
-                    <div class="metric-label">Internal Rate of Return</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">{roi_result.risk_score:.1f}/100</div>
-                    <div class="metric-label">Risk Score</div>
-                </div>
-            </div>
-            
-            <div class="confidence-interval">
-                <h4>📈 95% Confidence Interval</h4>
-                <p>Expected ROI range: <strong>{roi_result.confidence_interval[0]:.1f}% - {roi_result.confidence_interval[1]:.1f}%</strong></p>
-                <p><em>Based on Monte Carlo simulation with 1,000 iterations</em></p>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>💸 Cost Breakdown</h2>
-            <div class="cost-breakdown">
-                <table>
-                    <tr>
-                        <th>Cost Category</th>
-                        <th>Amount</th>
-                        <th>Percentage</th>
-                    </tr>
-                    <tr>
-                        <td>Development</td>
-                        <td>{currency_config.symbol}{cost_analysis['cost_breakdown']['development']:,.0f}</td>
-                        <td>{(cost_analysis['cost_breakdown']['development'] / cost_analysis['total_cost'] * 100):.1f}%</td>
-                    </tr>
-                    <tr>
-                        <td>Infrastructure</td>
-                        <td>{currency_config.symbol}{cost_analysis['cost_breakdown']['infrastructure']:,.0f}</td>
-                        <td>{(cost_analysis['cost_breakdown']['infrastructure'] / cost_analysis['total_cost'] * 100):.1f}%</td>
-                    </tr>
-                    <tr>
-                        <td>Annual Maintenance</td>
-                        <td>{currency_config.symbol}{cost_analysis['cost_breakdown']['maintenance_annual']:,.0f}</td>
-                        <td>{(cost_analysis['cost_breakdown']['maintenance_annual'] / cost_analysis['total_cost'] * 100):.1f}%</td>
-                    </tr>
-                    <tr>
-                        <td>Regulatory Compliance</td>
-                        <td>{currency_config.symbol}{cost_analysis['cost_breakdown']['regulatory_compliance']:,.0f}</td>
-                        <td>{(cost_analysis['cost_breakdown']['regulatory_compliance'] / cost_analysis['total_cost'] * 100):.1f}%</td>
-                    </tr>
-                    <tr>
-                        <td>Risk Buffer</td>
-                        <td>{currency_config.symbol}{cost_analysis['cost_breakdown']['risk_buffer']:,.0f}</td>
-                        <td>{(cost_analysis['cost_breakdown']['risk_buffer'] / cost_analysis['total_cost'] * 100):.1f}%</td>
-                    </tr>
-                </table>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>🌍 Market Insights</h2>
-            <table>
-                <tr><th>Metric</th><th>Value</th></tr>
-                <tr><td>Market Size</td><td>${market_insights['market_size_usd']:,}</td></tr>
-                <tr><td>Annual Growth Rate</td><td>{market_insights['annual_growth_rate']}</td></tr>
-                <tr><td>Risk Level</td><td><span class="risk-indicator risk-{market_insights['risk_level'].lower()}">{market_insights['risk_level']}</span></td></tr>
-                <tr><td>Market Volatility</td><td>{market_insights['volatility']}</td></tr>
-                <tr><td>Regulatory Complexity</td><td>{market_insights['regulatory_complexity']}</td></tr>
-                <tr><td>Investment Attractiveness</td><td>{market_insights['investment_attractiveness']}</td></tr>
-            </table>
-        </div>
-        
-        <div class="section">
-            <h2>💡 Strategic Recommendations</h2>
-            <div class="recommendations">
-                <ul>
-"""
-        
-        for rec in recommendations:
-            html_report += f"                    <li>{rec}</li>\n"
-        
-        html_report += f"""
-                </ul>
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p><strong>📄 Professional Business ROI Analysis</strong></p>
-            <p>Generated by Enhanced ROI Calculator v2.0 • {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
-            <p><strong>Methodology:</strong> Monte Carlo Simulation, NPV/IRR Analysis, Sensitivity Testing</p>
-            <p><small>💡 Tip: Use Ctrl+P (Cmd+P on Mac) to save this report as a PDF</small></p>
-        </div>
-    </div>
-</body>
-</html>
-"""
-        
-        return html_report, 200, {'Content-Type': 'text/html'}
-        
-    except ValidationError:
-        raise
-    except Exception as e:
-        logger.error(f"Error generating HTML report: {str(e)}")
-        raise ValidationError(f"Failed to generate report: {str(e)}")
+    # Get calculation parameters from URL
+    company_name = request.args.get('company', 'Sample Company')
+    company_size = request.args.get('company_size', 'medium')
+    current_industry = request.args.get('current_industry', 'saas')
+    project_type = request.args.get('project_type', 'product_development')
+    target_industry = request.args.get('target_industry', 'saas')
+    currency = request.args.get('currency', 'USD')
+    
+    # Validate parameters
+    validated_data = {
+        'company_name': APIValidator.validate_company_name(company_name),
+        'company_size': APIValidator.validate_company_size(company_size),
+        'current_industry': APIValidator.validate_industry(current_industry),
+        'project_type': APIValidator.validate_project_type(project_type),
+        'target_industry': APIValidator.validate_industry(target_industry),
+        'currency': APIValidator.validate_currency(currency)
+    }
+    
+    # Revalidated repeat requests skip the calculation and rendering
+    etag = hashlib.blake2b(_REPORT_ETAG_SALT + repr(sorted(validated_data.items())).encode(),
+                           digest_size=16).hexdigest()
+    headers = {'ETag': f'W/"{etag}"', 'Cache-Control': REPORT_CACHE_CONTROL}
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=headers)
+    
+    # Calculate everything before streaming: once the 200 headers are sent an
+    # error can no longer become a handle_validation_errors response
+    cost_analysis, roi_result = calculate_cached(validated_data)
+    calculator = get_calculator()
+    
+    market_insights = calculator.get_market_insights(validated_data['target_industry'])
+    recommendations = calculator.generate_recommendations(
+        validated_data['company_size'], 
+        validated_data['project_type'], 
+        validated_data['target_industry'],
+        roi_result
+    )
+    
+    # (label, amount, percentage of total) for the cost breakdown table
+    breakdown = cost_analysis['cost_breakdown']
+    total_cost = cost_analysis['total_cost']
+    cost_rows = [(label, breakdown[key], breakdown[key] / total_cost * 100)
+                 for key, label in REPORT_COST_ROWS]
+    
+    # Only template rendering runs inside the stream (templates/roi_report.html)
+    stream = stream_template(
+        'roi_report.html',
+        data=validated_data,
+        project=_PROJECTS[validated_data['project_type']],
+        currency=_CURRENCIES[validated_data['currency']],
+        cost=cost_analysis,
+        cost_rows=cost_rows,
+        roi=roi_result,
+        market=market_insights,
+        recommendations=recommendations,
+        generated_at=datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    )
+    
+    # Streamed bodies bypass the after_request compression, so encode here
+    encoding = negotiate_encoding(request.accept_encodings)
+    if encoding is None:
+        return Response(stream, mimetype='text/html', headers=headers)
+    
+    response = Response(compress_stream(stream, encoding, gzip_level=app.config['COMPRESS_LEVEL']),
+                        mimetype='text/html', headers=headers)
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
 
 # Advanced Interactive Features
 @app.route('/api/scenarios', methods=['POST'])
@@ -1002,6 +1046,11 @@ def compare_scenarios():
         'comparison': comparison
     })
 
+# Accepted /api/scenario-analysis options
+SCENARIO_TYPES = frozenset(['comprehensive', 'optimistic', 'pessimistic', 'monte_carlo',
+                            'sensitivity', 'stress_test', 'market_conditions'])
+VOLATILITY_LEVELS = frozenset(['low', 'medium', 'high', 'extreme'])
+
 @app.route('/api/scenario-analysis', methods=['POST'])
 @rate_limit(calculation_limiter, "Too many scenario analyses.")
 @handle_validation_errors
@@ -1011,7 +1060,7 @@ def calculate_comprehensive_scenario_analysis():
     data = request.get_json()
     if not data:
         raise ValidationError("No data provided", code="NO_DATA")
-
+    
     # Validate required fields (reuse existing validation)
     validated_data = APIValidator.validate_roi_calculation_request(data)
     
@@ -1021,57 +1070,72 @@ def calculate_comprehensive_scenario_analysis():
     volatility = data.get('volatility', 'medium')
     
     # Validate scenario parameters
-    if scenario_type not in ['comprehensive', 'optimistic', 'pessimistic', 'monte_carlo', 'sensitivity', 'stress_test', 'market_conditions']:
+    if not isinstance(scenario_type, str) or scenario_type not in SCENARIO_TYPES:
         raise ValidationError("Invalid scenario type", field="scenario_type")
     
     if not isinstance(risk_tolerance, (int, float)) or not (0 <= risk_tolerance <= 100):
         raise ValidationError("Risk tolerance must be between 0 and 100", field="risk_tolerance")
     
-    if volatility not in ['low', 'medium', 'high', 'extreme']:
+    if not isinstance(volatility, str) or volatility not in VOLATILITY_LEVELS:
         raise ValidationError("Invalid volatility level", field="volatility")
     
-    # Initialize calculator
-    calculator = ROICalculator()
-    
-    # Calculate scenario analysis
-    scenario_analysis = calculator.calculate_scenario_analysis(
-        project_type=validated_data['project_type'],
-        company_size=validated_data['company_size'],
-        industry=validated_data['target_industry'],
-        scenario_type=scenario_type,
-        risk_tolerance=int(risk_tolerance),
-        volatility=volatility,
-        investment=Decimal(str(validated_data['custom_investment'])) if validated_data.get('custom_investment') else None,
-        timeline=validated_data.get('custom_timeline'),
-        target_roi=validated_data.get('target_roi')
-    )
+    custom_investment = validated_data.get('custom_investment')
     
-    # Convert to JSON-serializable format
-    def scenario_to_dict(scenario):
+    def build_analysis_dict():
+        scenario_analysis = run_calculation(run_scenario_analysis, {
+            'project_type': validated_data['project_type'],
+            'company_size': validated_data['company_size'],
+            'industry': validated_data['target_industry'],
+            'scenario_type': scenario_type,
+            'risk_tolerance': int(risk_tolerance),
+            'volatility': volatility,
+            'investment': Decimal(str(custom_investment)) if custom_investment else None,
+            'timeline': validated_data.get('custom_timeline'),
+            'target_roi': validated_data.get('target_roi'),
+            'currency': validated_data['currency']
+        })
+        
+        # Decimal fields are encoded as numbers by the app's JSON provider
+        def scenario_to_dict(scenario):
+            return {
+                'scenario_id': scenario.scenario_id,
+                'roi_percentage': scenario.roi_percentage,
+                'npv': scenario.npv,
+                'payback_months': scenario.payback_months,
+                'risk_score': scenario.risk_score,
+                'market_condition': scenario.market_condition,
+                'confidence': scenario.confidence,
+                'parameters': scenario.parameters
+            }
+        
         return {
-            'scenario_id': scenario.scenario_id,
-            'roi_percentage': float(scenario.roi_percentage),
-            'npv': float(scenario.npv),
-            'payback_months': scenario.payback_months,
-            'risk_score': float(scenario.risk_score),
-            'market_condition': scenario.market_condition,
-            'confidence': float(scenario.confidence),
-            'parameters': scenario.parameters
+            'total_scenarios': scenario_analysis.total_scenarios,
+            'best_case': scenario_to_dict(scenario_analysis.best_case),
+            'worst_case': scenario_to_dict(scenario_analysis.worst_case),
+            'most_likely': scenario_to_dict(scenario_analysis.most_likely),
+            'average_roi': scenario_analysis.average_roi,
+            'median_roi': scenario_analysis.median_roi,
+            'success_probability': scenario_analysis.success_probability,
+            'risk_distribution': scenario_analysis.risk_distribution,
+            'scenario_breakdown': [scenario_to_dict(s) for s in scenario_analysis.scenario_breakdown]
         }
     
-    analysis_dict = {
-        'total_scenarios': scenario_analysis.total_scenarios,
-        'best_case': scenario_to_dict(scenario_analysis.best_case),
-        'worst_case': scenario_to_dict(scenario_analysis.worst_case),
-        'most_likely': scenario_to_dict(scenario_analysis.most_likely),
-        'average_roi': float(scenario_analysis.average_roi),
-        'median_roi': float(scenario_analysis.median_roi),
-        'success_probability': float(scenario_analysis.success_probability),
-        'risk_distribution': scenario_analysis.risk_distribution,
-        'scenario_breakdown': [scenario_to_dict(s) for s in scenario_analysis.scenario_breakdown]
-    }
+    # Repeat refreshes of the same inputs reuse the serialized analysis
+    cache_key = (
+        validated_data['project_type'],
+        validated_data['company_size'],
+        validated_data['target_industry'],
+        validated_data['currency'],
+        scenario_type,
+        int(risk_tolerance),
+        volatility,
+        str(custom_investment) if custom_investment else None,
+        validated_data.get('custom_timeline'),
+        validated_data.get('target_roi')
+    )
+    analysis_dict = scenario_cache.get_or_set(cache_key, build_analysis_dict)
     
-    calculation_id = f"scenario_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    calculation_id = next_calculation_id('scenario')
     
     return jsonify({
         'success': True,
@@ -1089,7 +1153,7 @@ def calculate_comprehensive_scenario_analysis():
             'scenario_type': scenario_type,
             'risk_tolerance': risk_tolerance,
             'volatility': volatility,
-            'custom_investment': str(validated_data['custom_investment']) if validated_data.get('custom_investment') else None,
+            'custom_investment': str(custom_investment) if custom_investment else None,
             'custom_timeline': validated_data.get('custom_timeline'),
             'target_roi': validated_data.get('target_roi')
         }
@@ -1177,6 +1241,7 @@ def internal_error(error):
         'details': str(error) if app.config['DEBUG'] else None
     }), 500
 
+# Werkzeug development server; production runs gunicorn -c gunicorn.conf.py app:app
 if __name__ == '__main__':
     logger.info(f"Starting Business ROI Calculator v2.0 in {config_class.ENV} mode")
     logger.info(f"Debug mode: {config_class.DEBUG}")
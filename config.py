@@ -104,6 +104,10 @@ class BaseConfig:
     MONTE_CARLO_ITERATIONS = int(os.environ.get('MONTE_CARLO_ITERATIONS') or 10000)
     CONFIDENCE_LEVEL = float(os.environ.get('CONFIDENCE_LEVEL') or 0.95)
     
+    # Calculation process pool (0 runs calculations in the request thread)
+    CALCULATION_WORKERS = int(os.environ.get('CALCULATION_WORKERS') or 0)
+    CALCULATION_TIMEOUT = int(os.environ.get('CALCULATION_TIMEOUT') or 30)
+    
     # Enhanced Currency Support
     CURRENCIES: Dict[str, CurrencyConfig] = {
         'USD': CurrencyConfig('$', 'US Dollar', 'USD', 2, '${:,.2f}', 1.0),
@@ -489,6 +493,7 @@ class BaseConfig:
     # Performance Configuration
     CACHE_TIMEOUT = int(os.environ.get('CACHE_TIMEOUT') or 300)
     SESSION_TIMEOUT = int(os.environ.get('SESSION_TIMEOUT') or 3600)
+    SEND_FILE_MAX_AGE_DEFAULT = 604800  # Static assets (report stylesheet) cached for a week
     MAX_WORKERS = int(os.environ.get('MAX_WORKERS') or 4)
     
     @classmethod
@@ -523,6 +528,7 @@ class TestingConfig(BaseConfig):
     DATABASE_URL = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = True
     MONTE_CARLO_ITERATIONS = 100  # Minimal for testing
+    CALCULATION_WORKERS = 0
 
 class ProductionConfig(BaseConfig):
     """Production configuration"""
@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for the ROI Calculator
+Production server settings: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+
+# Gunicorn workers already spread CPU-bound calculations over processes,
+# so each worker runs them inline instead of starting its own process pool
+os.environ.setdefault('CALCULATION_WORKERS', '0')
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WORKERS') or (os.cpu_count() or 1) * 2 + 1)
+# gthread suits the CPU-bound calculations (numba kernels release the GIL);
+# WORKER_CLASS=gevent only pays off with CALCULATION_WORKERS > 0 offloading them
+worker_class = os.environ.get('WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('THREADS', '4'))
+timeout = int(os.environ.get('TIMEOUT', '120'))
+keepalive = 2
+max_requests = int(os.environ.get('MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.environ.get('MAX_REQUESTS_JITTER', '50'))
+
+# Import the app (config, templates, swagger cache) once in the master
+preload_app = True
+
+def post_fork(server, worker):
+    """Build the calculator, its compiled kernels and the config-only responses before serving traffic"""
+    from app import get_calculator, prime_static_responses
+    get_calculator()
+    prime_static_responses()
@@ -0,0 +1,254 @@
+"""
+Test Suite for the v2 API (Flask-RESTx)
+Covers the compiled request validators, Monte Carlo scenarios and NDJSON batches
+"""
+
+import unittest
+import sys
+import os
+import json
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from flask import Flask
+    from flask_restx import Model, fields
+    import api_docs
+    from utils.validators import ValidationError
+except ImportError:
+    # Fallback for testing without Flask-RESTx installed
+    print("⚠️ Flask-RESTx not available - v2 API tests will be skipped")
+    api_docs = None
+
+BASE_PARAMETERS = {
+    'project_type': 'ecommerce_platform',
+    'company_size': 'medium',
+    'industry': 'saas',
+    'investment_amount': 50000,
+    'timeline_months': 12
+}
+
+
+def create_test_app():
+    """Register the v2 API on a bare Flask app"""
+    app = Flask(__name__)
+    api_docs.init_api_docs(app)
+    return app
+
+
+@unittest.skipIf(api_docs is None, "api_docs not available")
+class TestBatchStream(unittest.TestCase):
+    """Test the NDJSON streaming batch endpoint"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up the v2 API app"""
+        cls.app = create_test_app()
+    
+    def setUp(self):
+        """Set up test client"""
+        self.client = self.app.test_client()
+    
+    def post_lines(self, lines):
+        return self.client.post('/api/v2/api/calculations/batch/stream',
+                                data='\n'.join(lines) + '\n',
+                                content_type='application/x-ndjson')
+    
+    def test_one_result_per_line(self):
+        """Test each request line is answered by one result line, blank lines skipped"""
+        response = self.post_lines([json.dumps(BASE_PARAMETERS), '', json.dumps(BASE_PARAMETERS)])
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        results = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(result['success'] for result in results))
+        self.assertEqual(results[0]['total_investment'], 50000.0)
+    
+    def test_bad_lines_get_error_responses(self):
+        """Test invalid NDJSON lines get ErrorResponse lines and the rest still run"""
+        response = self.post_lines([
+            json.dumps(BASE_PARAMETERS),
+            '{not json',
+            json.dumps(dict(BASE_PARAMETERS, investment_amount=5)),
+            json.dumps(BASE_PARAMETERS)
+        ])
+        
+        self.assertEqual(response.status_code, 200)
+        results = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual([result['success'] for result in results], [True, False, False, True])
+        for result in results[1:3]:
+            self.assertEqual(result['error'], 'validation_error')
+            self.assertEqual(result['code'], 400)
+        self.assertEqual(results[2]['details'], {'field': 'investment_amount'})
+    
+    def test_internal_errors_are_hidden(self):
+        """Test unexpected calculation errors are reported without exception details"""
+        with mock.patch.object(api_docs, '_calculate_roi_item', side_effect=KeyError('secret')):
+            body = self.post_lines([json.dumps(BASE_PARAMETERS)]).get_data(as_text=True)
+        
+        self.assertEqual(json.loads(body)['error'], 'internal_error')
+        self.assertNotIn('secret', body)
+        self.assertNotIn('KeyError', body)
+
+
+
+@unittest.skipIf(api_docs is None, "api_docs not available")
+class TestMonteCarloEndpoint(unittest.TestCase):
+    """Test the v2 Monte Carlo scenario endpoint"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up the v2 API app"""
+        cls.app = create_test_app()
+    
+    def setUp(self):
+        """Set up test client with an empty response cache"""
+        self.client = self.app.test_client()
+        api_docs.response_cache.clear()
+    
+    def post_monte_carlo(self, payload):
+        return self.client.post('/api/v2/api/scenarios/monte-carlo', json=payload)
+    
+    def test_monte_carlo(self):
+        """Test a valid Monte Carlo request returns the scenario distribution"""
+        response = self.post_monte_carlo({
+            'base_parameters': BASE_PARAMETERS,
+            'scenario_type': 'monte_carlo',
+            'iterations': 2000
+        })
+        
+        self.assertEqual(response.status_code, 200)
+        analysis = response.get_json()['scenario_analysis']
+        self.assertEqual(analysis['total_scenarios'], 2000)
+        self.assertLessEqual(analysis['worst_case']['roi_percentage'], analysis['median_roi'])
+        self.assertLessEqual(analysis['median_roi'], analysis['best_case']['roi_percentage'])
+    
+    def test_cached_results_keep_requested_iterations(self):
+        """Test each iteration count is cached separately and reports its own total"""
+        for iterations in (2000, 5000, 2000):
+            response = self.post_monte_carlo({
+                'base_parameters': BASE_PARAMETERS,
+                'scenario_type': 'monte_carlo',
+                'iterations': iterations
+            })
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json()['scenario_analysis']['total_scenarios'], iterations)
+    
+    def test_monte_carlo_validation(self):
+        """Test bad Monte Carlo requests are 400s naming the field"""
+        cases = [
+            ({'scenario_type': 'monte_carlo'}, 'base_parameters'),
+            ({'base_parameters': BASE_PARAMETERS, 'scenario_type': 'monte_carlo', 'iterations': 0}, 'iterations'),
+            ({'base_parameters': BASE_PARAMETERS, 'scenario_type': 'monte_carlo', 'iterations': 10 ** 7}, 'iterations'),
+            ({'base_parameters': dict(BASE_PARAMETERS, industry=None), 'scenario_type': 'monte_carlo'}, 'industry')
+        ]
+        for payload, field in cases:
+            response = self.post_monte_carlo(payload)
+            self.assertEqual(response.status_code, 400, payload)
+            data = response.get_json()
+            self.assertEqual(data['error'], 'validation_error')
+            self.assertEqual(data['details']['field'], field)
+
+
+@unittest.skipIf(api_docs is None or not getattr(api_docs, 'NUMPY_AVAILABLE', False), "NumPy not available")
+class TestMonteCarloPaths(unittest.TestCase):
+    """Test the NumPy Monte Carlo sampling against the stdlib fallback"""
+    
+    def test_numpy_matches_fallback(self):
+        """Test both paths sample the same distribution"""
+        vectorized = api_docs.run_monte_carlo(BASE_PARAMETERS, 20000)
+        with mock.patch.object(api_docs, 'NUMPY_AVAILABLE', False):
+            fallback = api_docs.run_monte_carlo(BASE_PARAMETERS, 20000)
+        
+        self.assertEqual(vectorized.keys(), fallback.keys())
+        for key in ('average_roi', 'median_roi'):
+            self.assertAlmostEqual(vectorized[key], fallback[key], delta=5)
+        for case in ('worst_case', 'best_case'):
+            self.assertAlmostEqual(vectorized[case]['roi_percentage'],
+                                   fallback[case]['roi_percentage'], delta=10)
+        self.assertAlmostEqual(vectorized['success_probability'],
+                               fallback['success_probability'], delta=2)
+
+
+@unittest.skipIf(api_docs is None, "api_docs not available")
+class TestCompiledValidators(unittest.TestCase):
+    """Test validators compiled from request models"""
+    
+    def setUp(self):
+        """Build a validator for a small nested model"""
+        inner = Model('Inner', {
+            'size': fields.String(required=True, enum=['small', 'large'])
+        })
+        self.validate = api_docs._compile_validator(Model('Outer', {
+            'amount': fields.Float(required=True, min=1000, max=100000),
+            'months': fields.Integer(required=False, min=1, max=120),
+            'inner': fields.Nested(inner, required=False)
+        }))
+    
+    def assertRejected(self, payload, field, code):
+        with self.assertRaises(ValidationError) as context:
+            self.validate(payload)
+        self.assertEqual(context.exception.field, field)
+        self.assertEqual(context.exception.code, code)
+    
+    def test_valid_payload(self):
+        """Test a payload within every constraint passes"""
+        self.validate({'amount': 5000, 'months': 12, 'inner': {'size': 'small'}})
+        self.validate({'amount': 5000.5})
+    
+    def test_required_field(self):
+        """Test a missing required field is reported by name"""
+        self.assertRejected({'months': 12}, 'amount', 'required')
+    
+    def test_type_and_range(self):
+        """Test type, bool and min/max checks"""
+        self.assertRejected({'amount': '5000'}, 'amount', 'invalid_type')
+        self.assertRejected({'amount': True}, 'amount', 'invalid_type')
+        self.assertRejected({'amount': 5000, 'months': 1.5}, 'months', 'invalid_type')
+        self.assertRejected({'amount': 10}, 'amount', 'out_of_range')
+        self.assertRejected({'amount': 5000, 'months': 500}, 'months', 'out_of_range')
+    
+    def test_nested_model(self):
+        """Test nested models are validated recursively"""
+        self.assertRejected({'amount': 5000, 'inner': 'small'}, 'inner', 'invalid_type')
+        self.assertRejected({'amount': 5000, 'inner': {}}, 'size', 'required')
+        self.assertRejected({'amount': 5000, 'inner': {'size': 'huge'}}, 'size', 'invalid_choice')
+    
+    def test_non_object_body(self):
+        """Test a non-object body is rejected"""
+        with self.assertRaises(ValidationError):
+            self.validate([{'amount': 5000}])
+    
+    def test_roi_endpoint_rejects_invalid_payload(self):
+        """Test the /roi endpoint answers validator failures with an ErrorResponse 400"""
+        client = create_test_app().test_client()
+        response = client.post('/api/v2/api/calculations/roi',
+                               json=dict(BASE_PARAMETERS, investment_amount=5))
+        
+        self.assertEqual(response.status_code, 400)
+        data = response.get_json()
+        self.assertEqual(data['error'], 'validation_error')
+        self.assertEqual(data['details'], {'field': 'investment_amount'})
+    
+    @unittest.skipIf(not getattr(api_docs, 'ORJSON_AVAILABLE', False), "orjson not available")
+    def test_request_bodies_parsed_with_orjson(self):
+        """Test get_json() goes through the orjson provider and malformed bodies are 400s"""
+        app = create_test_app()
+        self.assertIsInstance(app.json, api_docs.OrjsonRequestProvider)
+        
+        client = app.test_client()
+        with mock.patch.object(api_docs.OrjsonRequestProvider, 'loads',
+                               autospec=True, side_effect=lambda self, s: json.loads(s)) as loads:
+            response = client.post('/api/v2/api/calculations/roi', json=BASE_PARAMETERS)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(loads.called)
+        
+        response = client.post('/api/v2/api/calculations/roi', data='{bad',
+                               content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
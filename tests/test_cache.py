@@ -0,0 +1,94 @@
+"""
+Test Suite for the in-process response and calculation caches
+Covers LRU eviction, TTL expiry and concurrent access
+"""
+
+import unittest
+import sys
+import os
+import threading
+from datetime import datetime, timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache import SimpleCache
+
+
+class TestSimpleCache(unittest.TestCase):
+    """Test SimpleCache LRU and TTL behaviour"""
+    
+    def test_get_returns_stored_value(self):
+        """Test a stored value is returned until it expires"""
+        cache = SimpleCache(default_ttl=60)
+        cache.set('key', {'roi': 120})
+        
+        self.assertEqual(cache.get('key'), {'roi': 120})
+        self.assertIsNone(cache.get('missing'))
+    
+    def test_expired_entry_is_dropped(self):
+        """Test entries past their TTL are treated as misses and removed"""
+        cache = SimpleCache(default_ttl=60)
+        cache.set('key', 'value')
+        cache.cache['key']['expires'] = datetime.utcnow() - timedelta(seconds=1)
+        
+        self.assertIsNone(cache.get('key'))
+        self.assertNotIn('key', cache.cache)
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted beyond max_entries"""
+        cache = SimpleCache(default_ttl=60, max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')  # 'b' is now the least recently used
+        cache.set('c', 3)
+        
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+    
+    def test_get_or_set_calculates_once(self):
+        """Test get_or_set only calls the calculator on a miss"""
+        cache = SimpleCache(default_ttl=60)
+        calls = []
+        
+        def calculate():
+            calls.append(1)
+            return 'result'
+        
+        for _ in range(3):
+            self.assertEqual(cache.get_or_set(('saas', 'medium'), calculate), 'result')
+        self.assertEqual(len(calls), 1)
+    
+    def test_dict_keys_are_order_independent(self):
+        """Test dict inputs hash to the same key regardless of insertion order"""
+        cache = SimpleCache()
+        
+        self.assertEqual(cache._generate_key({'a': 1, 'b': 2}),
+                         cache._generate_key({'b': 2, 'a': 1}))
+    
+    def test_concurrent_access_respects_bound(self):
+        """Test concurrent get/set from several threads keeps the LRU consistent"""
+        cache = SimpleCache(default_ttl=60, max_entries=50)
+        errors = []
+        
+        def worker(thread_id):
+            try:
+                for i in range(2000):
+                    cache.set((thread_id, i % 200), i)
+                    cache.get((thread_id, (i + 7) % 200))
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(errors, [])
+        self.assertEqual(cache.stats()['total_entries'], 50)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
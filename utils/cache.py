@@ -6,41 +6,56 @@ Improves performance by caching expensive calculations
 import time
 import hashlib
 import json
-from typing import Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Hashable, Optional, Tuple, Union
 from datetime import datetime, timedelta
 
 class SimpleCache:
     """Thread-safe simple cache with TTL support"""
     
-    def __init__(self, default_ttl: int = 300):  # 5 minutes default
-        self.cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, default_ttl: int = 300, max_entries: Optional[int] = None):  # 5 minutes default
+        self.cache: Dict[Hashable, Dict[str, Any]] = OrderedDict()
+        # Guards every read-modify-write of the LRU order (gthread workers share the cache)
+        self._lock = threading.Lock()
         self.default_ttl = default_ttl
+        # Least recently used entries are evicted beyond max_entries (None = unbounded)
+        self.max_entries = max_entries
     
-    def _generate_key(self, data: Dict[str, Any]) -> str:
-        """Generate cache key from input data"""
+    def _generate_key(self, data: Union[Dict[str, Any], Tuple]) -> Hashable:
+        """Generate cache key from input data
+        
+        Tuples of hashable values are used as keys directly; dicts are
+        serialized and hashed.
+        """
+        if isinstance(data, tuple):
+            return data
+        
         # Sort keys for consistent hashing
         sorted_data = json.dumps(data, sort_keys=True, default=str)
         return hashlib.md5(sorted_data.encode()).hexdigest()
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Get value from cache if not expired"""
-        if key in self.cache:
-            entry = self.cache[key]
-            if datetime.utcnow() < entry['expires']:
-                entry['hits'] += 1
-                entry['last_accessed'] = datetime.utcnow()
-                return entry['data']
-            else:
-                # Expired entry
-                del self.cache[key]
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                if datetime.utcnow() < entry['expires']:
+                    entry['hits'] += 1
+                    entry['last_accessed'] = datetime.utcnow()
+                    self.cache.move_to_end(key)
+                    return entry['data']
+                else:
+                    # Expired entry
+                    del self.cache[key]
         return None
     
-    def set(self, key: str, data: Any, ttl: Optional[int] = None) -> None:
+    def set(self, key: Hashable, data: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache with TTL"""
         ttl = ttl or self.default_ttl
         expires = datetime.utcnow() + timedelta(seconds=ttl)
         
-        self.cache[key] = {
+        entry = {
             'data': data,
             'expires': expires,
             'created': datetime.utcnow(),
@@ -48,11 +63,19 @@ class SimpleCache:
             'last_accessed': datetime.utcnow()
         }
         
-        # Clean up expired entries periodically
-        if len(self.cache) > 100:  # Cleanup when cache gets large
-            self._cleanup_expired()
+        with self._lock:
+            self.cache[key] = entry
+            self.cache.move_to_end(key)
+            
+            # Clean up expired entries periodically
+            if len(self.cache) > 100:  # Cleanup when cache gets large
+                self._cleanup_expired()
+            
+            if self.max_entries is not None:
+                while len(self.cache) > self.max_entries:
+                    self.cache.popitem(last=False)
     
-    def get_or_set(self, data: Dict[str, Any], calculator_func, ttl: Optional[int] = None) -> Any:
+    def get_or_set(self, data: Union[Dict[str, Any], Tuple], calculator_func, ttl: Optional[int] = None) -> Any:
         """Get from cache or calculate and set"""
         key = self._generate_key(data)
         
@@ -67,7 +90,7 @@ class SimpleCache:
         return result
     
     def _cleanup_expired(self) -> None:
-        """Remove expired entries"""
+        """Remove expired entries (caller holds the lock)"""
         now = datetime.utcnow()
         expired_keys = [
             key for key, entry in self.cache.items()
@@ -78,21 +101,24 @@ class SimpleCache:
     
     def clear(self) -> None:
         """Clear all cache entries"""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         now = datetime.utcnow()
-        active_entries = sum(1 for entry in self.cache.values() if now < entry['expires'])
-        total_hits = sum(entry['hits'] for entry in self.cache.values())
+        with self._lock:
+            entries = list(self.cache.values())
+        active_entries = sum(1 for entry in entries if now < entry['expires'])
+        total_hits = sum(entry['hits'] for entry in entries)
         
         return {
-            'total_entries': len(self.cache),
+            'total_entries': len(entries),
             'active_entries': active_entries,
             'total_hits': total_hits,
-            'hit_rate': total_hits / max(len(self.cache), 1),
-            'oldest_entry': min((entry['created'] for entry in self.cache.values()), default=None),
-            'newest_entry': max((entry['created'] for entry in self.cache.values()), default=None)
+            'hit_rate': total_hits / max(len(entries), 1),
+            'oldest_entry': min((entry['created'] for entry in entries), default=None),
+            'newest_entry': max((entry['created'] for entry in entries), default=None)
         }
 
 # Global cache instance
@@ -0,0 +1,75 @@
+"""
+Response compression for the ROI Calculator
+Brotli/gzip encoding of JSON and HTML responses without extra middleware
+"""
+
+import gzip
+import zlib
+
+# Optional Brotli support, gzip is always available
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+COMPRESSIBLE_MIMETYPES = frozenset(['application/json', 'application/msgpack',
+                                    'text/html', 'text/css', 'text/csv'])
+
+def negotiate_encoding(accept_encodings):
+    """Pick br or gzip from the client's Accept-Encoding, None for identity"""
+    if BROTLI_AVAILABLE and 'br' in accept_encodings:
+        return 'br'
+    if 'gzip' in accept_encodings:
+        return 'gzip'
+    return None
+
+def compress_stream(chunks, encoding: str, gzip_level: int = 6, brotli_quality: int = 4):
+    """Encode an iterable of str/bytes chunks incrementally with br or gzip"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=brotli_quality)
+        process, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+        process, finish = compressor.compress, compressor.flush
+
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        data = process(chunk)
+        if data:
+            yield data
+    yield finish()
+
+def compress_response(response, accept_encodings, min_size: int = 500,
+                      gzip_level: int = 6, brotli_quality: int = 4):
+    """Compress a Flask response in place with br or gzip when worthwhile
+
+    Skips error and streamed responses, bodies that are already encoded or
+    smaller than min_size, and mimetypes that do not compress well.
+    """
+    if (response.status_code < 200 or response.status_code >= 300
+            or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    body = response.get_data()
+    if len(body) < min_size:
+        return response
+
+    encoding = negotiate_encoding(accept_encodings)
+    if encoding == 'br':
+        response.set_data(brotli.compress(body, quality=brotli_quality))
+    elif encoding == 'gzip':
+        response.set_data(gzip.compress(body, compresslevel=gzip_level))
+    else:
+        return response
+    response.headers['Content-Encoding'] = encoding
+
+    # The encoded body differs byte-wise, so a strong ETag becomes a weak one
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    response.vary.add('Accept-Encoding')
+    return response
@@ -4,6 +4,8 @@ Generates professional reports in multiple formats
 """
 
 import os
+import csv
+import io
 import json
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -11,6 +13,27 @@ from decimal import Decimal
 from dataclasses import asdict
 import base64
 
+# Optional orjson for faster JSON exports, stdlib json without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Styles for the self-contained executive summary, kept out of the report f-string
+EXECUTIVE_SUMMARY_CSS = """\
+                body { font-family: 'Segoe UI', Arial, sans-serif; margin: 0; padding: 20px; background: #f8f9fa; }
+                .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; }
+                .executive-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }
+                .metric-card { background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+                .metric-value { font-size: 2em; font-weight: bold; color: #667eea; }
+                .metric-label { color: #666; margin-top: 5px; }
+                .risk-low { color: #28a745; }
+                .risk-medium { color: #ffc107; }
+                .risk-high { color: #dc3545; }
+                .recommendation { background: #e8f5e8; border-left: 4px solid #28a745; padding: 15px; margin: 10px 0; }
+                .footer { text-align: center; margin-top: 30px; color: #666; }"""
+
 class ReportGenerator:
     """Generate professional business reports"""
     
@@ -36,17 +59,7 @@ class ReportGenerator:
             <meta charset="UTF-8">
             <title>Executive Summary - ROI Analysis</title>
             <style>
-                body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 0; padding: 20px; background: #f8f9fa; }}
-                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; }}
-                .executive-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }}
-                .metric-card {{ background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-                .metric-value {{ font-size: 2em; font-weight: bold; color: #667eea; }}
-                .metric-label {{ color: #666; margin-top: 5px; }}
-                .risk-low {{ color: #28a745; }}
-                .risk-medium {{ color: #ffc107; }}
-                .risk-high {{ color: #dc3545; }}
-                .recommendation {{ background: #e8f5e8; border-left: 4px solid #28a745; padding: 15px; margin: 10px 0; }}
-                .footer {{ text-align: center; margin-top: 30px; color: #666; }}
+{EXECUTIVE_SUMMARY_CSS}
             </style>
         </head>
         <body>
@@ -245,6 +258,8 @@ class ReportGenerator:
             'recommendations': data.get('recommendations', [])
         }
         
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(export_data, default=str, option=orjson.OPT_INDENT_2).decode('utf-8')
         return json.dumps(export_data, indent=2, default=str)
     
     def generate_csv_export(self, data: Dict[str, Any]) -> str:
@@ -252,20 +267,25 @@ class ReportGenerator:
         roi = data['roi_projection']
         cost = data['cost_analysis']
         
-        csv_content = "Metric,Value,Unit\n"
-        csv_content += f"Company Name,{data['input_parameters']['company_name']},text\n"
-        csv_content += f"Project Type,{data['input_parameters']['project_type']},text\n"
-        csv_content += f"Total Investment,{cost['total_cost']},currency\n"
-        csv_content += f"Projected Revenue,{roi['projected_revenue']},currency\n"
-        csv_content += f"Net Profit,{roi['net_profit']},currency\n"
-        csv_content += f"ROI Percentage,{roi['roi_percentage']},percentage\n"
-        csv_content += f"Payback Period,{roi['payback_period_months']},months\n"
-        csv_content += f"NPV,{roi['npv']},currency\n"
-        csv_content += f"IRR,{roi['irr']},percentage\n"
-        csv_content += f"Risk Score,{roi['risk_score']},percentage\n"
-        csv_content += f"Generated At,{datetime.now().isoformat()},datetime\n"
+        # csv.writer quotes values containing commas or quotes (e.g. company names)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerows([
+            ('Metric', 'Value', 'Unit'),
+            ('Company Name', data['input_parameters']['company_name'], 'text'),
+            ('Project Type', data['input_parameters']['project_type'], 'text'),
+            ('Total Investment', cost['total_cost'], 'currency'),
+            ('Projected Revenue', roi['projected_revenue'], 'currency'),
+            ('Net Profit', roi['net_profit'], 'currency'),
+            ('ROI Percentage', roi['roi_percentage'], 'percentage'),
+            ('Payback Period', roi['payback_period_months'], 'months'),
+            ('NPV', roi['npv'], 'currency'),
+            ('IRR', roi['irr'], 'percentage'),
+            ('Risk Score', roi['risk_score'], 'percentage'),
+            ('Generated At', datetime.now().isoformat(), 'datetime')
+        ])
         
-        return csv_content
+        return buffer.getvalue()
     
     def _get_risk_level(self, risk_score: float) -> str:
         """Get risk level description"""
@@ -282,11 +302,12 @@ class ReportGenerator:
     
     def _generate_cost_table_rows(self, cost_breakdown: Dict, total_cost: float) -> str:
         """Generate cost breakdown table rows"""
-        rows = ""
-        for category, amount in cost_breakdown.items():
-            percentage = (float(amount) / float(total_cost)) * 100
-            rows += f"<tr><td>{category.replace('_', ' ').title()}</td><td>${float(amount):,.0f}</td><td>{percentage:.1f}%</td></tr>"
-        return rows
+        total_cost = float(total_cost)
+        return "".join(
+            f"<tr><td>{category.replace('_', ' ').title()}</td><td>${float(amount):,.0f}</td>"
+            f"<td>{float(amount) / total_cost * 100:.1f}%</td></tr>"
+            for category, amount in cost_breakdown.items()
+        )
     
     def _generate_business_intelligence_section(self, bi: Dict) -> str:
         """Generate business intelligence section"""
@@ -336,12 +357,11 @@ class ReportGenerator:
             ('Technology Risk', risk_analysis.get('technology_risk', 0))
         ]
         
-        html = ""
-        for risk_name, risk_value in risks:
-            risk_class = 'risk-low' if risk_value < 30 else 'risk-medium' if risk_value < 60 else 'risk-high'
-            html += f'<div class="risk-item {risk_class}"><strong>{risk_name}</strong><br>{risk_value:.1f}%</div>'
-        
-        return html
+        return "".join(
+            f'<div class="risk-item {"risk-low" if risk_value < 30 else "risk-medium" if risk_value < 60 else "risk-high"}">'
+            f'<strong>{risk_name}</strong><br>{risk_value:.1f}%</div>'
+            for risk_name, risk_value in risks
+        )
     
     def _generate_basic_risk_assessment(self, risk_score: float) -> str:
         """Generate basic risk assessment when detailed analysis not available"""
@@ -350,14 +370,11 @@ class ReportGenerator:
     
     def _generate_recommendations_section(self, recommendations: list, bi: Dict) -> str:
         """Generate recommendations section"""
-        html = "<ul>"
-        
         if bi and bi.get('recommended_actions'):
-            for rec in bi['recommended_actions']:
-                html += f"<li style='margin: 10px 0; padding: 10px; background: #e8f5e8; border-radius: 5px;'>{rec}</li>"
-        else:
-            for rec in recommendations:
-                html += f"<li style='margin: 10px 0; padding: 10px; background: #e8f5e8; border-radius: 5px;'>{rec}</li>"
+            recommendations = bi['recommended_actions']
         
-        html += "</ul>"
-        return html
\ No newline at end of file
+        items = "".join(
+            f"<li style='margin: 10px 0; padding: 10px; background: #e8f5e8; border-radius: 5px;'>{rec}</li>"
+            for rec in recommendations
+        )
+        return f"<ul>{items}</ul>"
\ No newline at end of file
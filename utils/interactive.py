@@ -6,6 +6,7 @@ Scenario comparison, what-if analysis, and real-time adjustments
 from typing import Dict, List, Any, Tuple
 from decimal import Decimal
 import json
+from collections import OrderedDict
 from datetime import datetime
 from utils.calculator import EnhancedROICalculator
 from utils.analytics import AdvancedAnalyticsEngine
@@ -13,10 +14,12 @@ from utils.analytics import AdvancedAnalyticsEngine
 class ScenarioManager:
     """Manage multiple ROI scenarios for comparison"""
     
-    def __init__(self):
+    def __init__(self, max_scenarios: int = 512):
         self.calculator = EnhancedROICalculator()
         self.analytics = AdvancedAnalyticsEngine()
-        self.scenarios = {}
+        # Least recently used scenarios are dropped once max_scenarios is reached
+        self.max_scenarios = max_scenarios
+        self.scenarios = OrderedDict()
     
     def create_scenario(self, scenario_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new scenario with given parameters"""
@@ -60,6 +63,9 @@ class ScenarioManager:
         }
         
         self.scenarios[scenario_name] = scenario_data
+        self.scenarios.move_to_end(scenario_name)
+        while len(self.scenarios) > self.max_scenarios:
+            self.scenarios.popitem(last=False)
         return scenario_data
     
     def compare_scenarios(self, scenario_names: List[str]) -> Dict[str, Any]:
@@ -76,6 +82,7 @@ class ScenarioManager:
         
         for name in scenario_names:
             if name in self.scenarios:
+                self.scenarios.move_to_end(name)
                 scenario = self.scenarios[name]
                 comparison['scenarios'].append({
                     'name': name,
@@ -15,6 +15,25 @@ from config import Config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Valid option keys, bound once so each check is a single set lookup
+VALID_CURRENCIES = frozenset(Config.CURRENCIES)
+VALID_COMPANY_SIZES = frozenset(Config.COMPANY_SIZES)
+VALID_INDUSTRIES = frozenset(Config.INDUSTRIES)
+VALID_PROJECT_TYPES = frozenset(Config.PROJECT_TYPES)
+
+# Patterns used on every request, compiled once
+_NON_NUMERIC = re.compile(r'[^\d.-]')
+_COMPANY_NAME_CHARS = re.compile(r'[a-zA-Z0-9\s\-\.\,\&\'\"]+')
+_CONTROL_CHARS = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_WHITESPACE_RUN = re.compile(r'\s+')
+_UNSAFE_CHARS = re.compile(r'[<>"\']')
+_SQL_KEYWORDS = re.compile(r'(union|select|insert|update|delete|drop|create|alter)\s', re.IGNORECASE)
+_COMPANY_NAME_DISALLOWED = re.compile(r'[^a-zA-Z0-9\s\-\.\,\&\(\)]')
+
+# Company names that sanitize_company_name() would return unchanged:
+# allowed characters only, single inner spaces, no surrounding whitespace
+_CLEAN_COMPANY_NAME = re.compile(r'[a-zA-Z0-9\-.,&()]+(?: [a-zA-Z0-9\-.,&()]+)*')
+
 class ValidationError(Exception):
     """Custom validation error with detailed error information"""
     def __init__(self, message: str, field: str = None, value: Any = None, code: str = None, details: List = None):
@@ -64,7 +83,7 @@ class APIValidator:
         
         currency = currency.upper().strip()
         
-        if currency not in Config.CURRENCIES:
+        if currency not in VALID_CURRENCIES:
             valid_currencies = list(Config.CURRENCIES.keys())
             raise ValidationError(
                 f"Invalid currency '{currency}'. Valid currencies: {', '.join(valid_currencies)}",
@@ -81,7 +100,7 @@ class APIValidator:
         
         company_size = company_size.lower().strip()
         
-        if company_size not in Config.COMPANY_SIZES:
+        if company_size not in VALID_COMPANY_SIZES:
             valid_sizes = list(Config.COMPANY_SIZES.keys())
             raise ValidationError(
                 f"Invalid company size '{company_size}'. Valid sizes: {', '.join(valid_sizes)}",
@@ -98,7 +117,7 @@ class APIValidator:
         
         industry = industry.lower().strip()
         
-        if industry not in Config.INDUSTRIES:
+        if industry not in VALID_INDUSTRIES:
             valid_industries = list(Config.INDUSTRIES.keys())
             raise ValidationError(
                 f"Invalid industry '{industry}'. Valid industries: {', '.join(valid_industries)}",
@@ -115,7 +134,7 @@ class APIValidator:
         
         project_type = project_type.lower().strip()
         
-        if project_type not in Config.PROJECT_TYPES:
+        if project_type not in VALID_PROJECT_TYPES:
             valid_types = list(Config.PROJECT_TYPES.keys())
             raise ValidationError(
                 f"Invalid project type '{project_type}'. Valid types: {', '.join(valid_types)}",
@@ -134,7 +153,7 @@ class APIValidator:
             # Convert to Decimal for precise calculations
             if isinstance(amount, str):
                 # Remove currency symbols and formatting
-                cleaned_amount = re.sub(r'[^\d.-]', '', amount)
+                cleaned_amount = _NON_NUMERIC.sub('', amount)
                 decimal_amount = Decimal(cleaned_amount)
             else:
                 decimal_amount = Decimal(str(amount))
@@ -188,7 +207,7 @@ class APIValidator:
             )
         
         # Check for valid characters (letters, numbers, spaces, common punctuation)
-        if not re.match(r'^[a-zA-Z0-9\s\-\.\,\&\'\"]+$', company_name):
+        if not _COMPANY_NAME_CHARS.fullmatch(company_name):
             raise ValidationError(
                 "Company name contains invalid characters",
                 "company_name", company_name, "INVALID_CHARACTERS"
@@ -326,15 +345,15 @@ class DataSanitizer:
             return str(value)
         
         # Remove control characters and normalize whitespace
-        sanitized = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', value)
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        sanitized = _CONTROL_CHARS.sub('', value)
+        sanitized = _WHITESPACE_RUN.sub(' ', sanitized)
         sanitized = sanitized.strip()
         
         if not allow_special:
             # Remove potentially dangerous characters
-            sanitized = re.sub(r'[<>"\']', '', sanitized)
+            sanitized = _UNSAFE_CHARS.sub('', sanitized)
             # Remove SQL injection patterns
-            sanitized = re.sub(r'(union|select|insert|update|delete|drop|create|alter)\s', '', sanitized, flags=re.IGNORECASE)
+            sanitized = _SQL_KEYWORDS.sub('', sanitized)
         
         # Validate length
         if max_length and len(sanitized) > max_length:
@@ -352,9 +371,13 @@ class DataSanitizer:
         if not value:
             raise ValidationError("Company name is required", "company_name", value, "REQUIRED")
         
+        # Fast path: already clean names need no rewriting
+        if 2 <= len(value) <= 100 and _CLEAN_COMPANY_NAME.fullmatch(value):
+            return value
+        
         # Allow letters, numbers, spaces, and common business characters
-        sanitized = re.sub(r'[^a-zA-Z0-9\s\-\.\,\&\(\)]', '', value)
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+        sanitized = _COMPANY_NAME_DISALLOWED.sub('', value)
+        sanitized = _WHITESPACE_RUN.sub(' ', sanitized).strip()
         
         if len(sanitized) < 2:
             raise ValidationError("Company name too short after sanitization", "company_name", value, "TOO_SHORT")
@@ -369,7 +392,7 @@ class DataSanitizer:
         
         if isinstance(value, str):
             # Remove non-numeric characters except decimal point and minus
-            cleaned = re.sub(r'[^\d.-]', '', value)
+            cleaned = _NON_NUMERIC.sub('', value)
             try:
                 if '.' in cleaned:
                     return float(cleaned)
@@ -387,13 +410,14 @@ def handle_validation_errors(f):
         try:
             return f(*args, **kwargs)
         except ValidationError as e:
-            logger.warning(f"Validation error in {f.__name__}: {e.message}")
+            logger.warning("Validation error in %s: %s", f.__name__, e.message)
             return {'error': True, 'validation_error': e.to_dict()}, 400
         except BusinessLogicError as e:
-            logger.warning(f"Business logic error in {f.__name__}: {e.message}")
+            logger.warning("Business logic error in %s: %s", f.__name__, e.message)
             return {'error': True, 'business_error': e.to_dict()}, 422
         except Exception as e:
-            logger.error(f"Unexpected error in {f.__name__}: {str(e)}")
+            # Routes carry no try/except of their own; log the traceback here
+            logger.exception("Unexpected error in %s: %s", f.__name__, e)
             return {
                 'error': True, 
                 'message': 'An unexpected error occurred',